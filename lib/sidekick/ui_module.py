@@ -26,10 +26,16 @@ Dependencies:
 
 from __future__ import annotations
 
+import functools
 import math
+import string
+import sys
 import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -39,7 +45,7 @@ _QT_AVAILABLE = False
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QGridLayout, QSplitter, QTextEdit, QLineEdit, QPushButton, QLabel,
+        QGridLayout, QSplitter, QTextEdit, QPlainTextEdit, QLineEdit, QPushButton, QLabel,
         QProgressBar, QGroupBox, QScrollArea, QFrame, QDialog,
         QComboBox, QCheckBox, QStackedWidget, QSizePolicy,
         QToolBar, QStatusBar, QMessageBox, QTabWidget, QFileDialog,
@@ -47,6 +53,7 @@ try:
     from PyQt6.QtCore import (
         Qt, QTimer, QSize, pyqtSignal, pyqtSlot, QThread,
         QPropertyAnimation, QEasingCurve, QObject, QPointF, QRectF,
+        QRunnable, QThreadPool, QEvent,
     )
     from PyQt6.QtGui import (
         QImage, QPixmap, QFont, QColor, QPalette, QIcon,
@@ -58,7 +65,7 @@ except ImportError:
     try:
         from PyQt5.QtWidgets import (  # type: ignore[no-redef]
             QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-            QGridLayout, QSplitter, QTextEdit, QLineEdit, QPushButton, QLabel,
+            QGridLayout, QSplitter, QTextEdit, QPlainTextEdit, QLineEdit, QPushButton, QLabel,
             QProgressBar, QGroupBox, QScrollArea, QFrame, QDialog,
             QComboBox, QCheckBox, QStackedWidget, QSizePolicy,
             QAction, QToolBar, QStatusBar, QMessageBox, QTabWidget, QFileDialog,
@@ -66,6 +73,7 @@ except ImportError:
         from PyQt5.QtCore import (  # type: ignore[no-redef]
             Qt, QTimer, QSize, pyqtSignal, pyqtSlot, QThread,
             QPropertyAnimation, QEasingCurve, QObject, QPointF, QRectF,
+            QRunnable, QThreadPool, QEvent,
         )
         from PyQt5.QtGui import (  # type: ignore[no-redef]
             QImage, QPixmap, QFont, QColor, QPalette, QIcon,
@@ -76,6 +84,57 @@ except ImportError:
     except ImportError:
         pass
 
+# Qt6/Qt5 enum spellings resolved once instead of per widget.
+if _QT_AVAILABLE:
+    _TEXT_SELECTABLE = (
+        Qt.TextInteractionFlag.TextSelectableByMouse
+        if hasattr(Qt, "TextInteractionFlag")
+        else Qt.TextSelectableByMouse
+    )
+    _SCROLLBAR_OFF = (
+        Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        if hasattr(Qt, "ScrollBarPolicy")
+        else Qt.ScrollBarAlwaysOff
+    )
+    _ALIGN_CENTER = (
+        Qt.AlignmentFlag.AlignCenter if hasattr(Qt, "AlignmentFlag") else Qt.AlignCenter
+    )
+    _ALIGN_LEFT = (
+        Qt.AlignmentFlag.AlignLeft if hasattr(Qt, "AlignmentFlag") else Qt.AlignLeft
+    )
+    _ALIGN_TOP = (
+        Qt.AlignmentFlag.AlignTop if hasattr(Qt, "AlignmentFlag") else Qt.AlignTop
+    )
+    _FRAME_NOFRAME = (
+        QFrame.Shape.NoFrame if hasattr(QFrame, "Shape") else QFrame.NoFrame
+    )
+    _WA_STYLED_BACKGROUND = (
+        Qt.WidgetAttribute.WA_StyledBackground
+        if hasattr(Qt, "WidgetAttribute")
+        else Qt.WA_StyledBackground
+    )
+    _Key = Qt.Key if hasattr(Qt, "Key") else Qt
+    _KEY_RETURN = _Key.Key_Return
+    _KEY_ENTER = _Key.Key_Enter
+    _KEY_ESCAPE = _Key.Key_Escape
+    _KEY_UP = _Key.Key_Up
+    _KEY_DOWN = _Key.Key_Down
+    _MOD_SHIFT = (
+        Qt.KeyboardModifier.ShiftModifier
+        if hasattr(Qt, "KeyboardModifier")
+        else Qt.ShiftModifier
+    )
+    _MoveOp = (
+        QTextCursor.MoveOperation if hasattr(QTextCursor, "MoveOperation") else QTextCursor
+    )
+    _MOVE_END = _MoveOp.End
+    _SELECT_DOCUMENT = (
+        QTextCursor.SelectionType.Document
+        if hasattr(QTextCursor, "SelectionType")
+        else QTextCursor.Document
+    )
+    del _Key, _MoveOp
+
 
 # ===================================================================
 # AudioCueManager -- stub (pygame removed)
@@ -260,26 +319,33 @@ THEMES = {
 
 _THEME_CYCLE = ["dark", "high_contrast", "light"]
 
+# Share one str object per colour value across all theme classes, so the
+# stylesheet templating and per-widget f-strings reuse identical objects.
+for _theme_cls in (*THEMES.values(), Glass):
+    for _k, _v in list(vars(_theme_cls).items()):
+        if isinstance(_v, str) and not _k.startswith("_"):
+            setattr(_theme_cls, _k, sys.intern(_v))
+del _theme_cls, _k, _v
+
 
 # ===================================================================
 # Stylesheet builder
 # ===================================================================
 
-def build_stylesheet(theme: type = Theme) -> str:
-    """Build an Apple-style monochrome Qt stylesheet from a theme class."""
-    g = Glass
-    return f"""
+# Static template: theme attributes as ``{NAME}``, Glass constants as
+# ``{glass_NAME}``.  Filled once per theme via str.format_map.
+_STYLE_TEMPLATE = """
 /* ---- Global ---- */
 QMainWindow, QWidget {{
-    background-color: {theme.BG_PRIMARY};
-    color: {theme.TEXT_PRIMARY};
+    background-color: {BG_PRIMARY};
+    color: {TEXT_PRIMARY};
     font-family: 'Inter', 'Segoe UI', 'Helvetica Neue', -apple-system, sans-serif;
     font-size: 13px;
 }}
 
 /* ---- Splitter ---- */
 QSplitter::handle {{
-    background: {theme.BORDER};
+    background: {BORDER};
     width: 1px;
 }}
 QSplitter::handle:hover {{
@@ -289,9 +355,9 @@ QSplitter::handle:hover {{
 
 /* ---- Line Edit ---- */
 QLineEdit {{
-    background-color: {g.INPUT_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.INPUT_BORDER};
+    background-color: {glass_INPUT_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_INPUT_BORDER};
     border-radius: 18px;
     padding: 10px 16px;
     font-size: 14px;
@@ -303,42 +369,58 @@ QLineEdit:focus {{
 
 /* ---- Text Edit ---- */
 QTextEdit {{
-    background-color: {theme.BG_SECONDARY};
-    color: {theme.TEXT_PRIMARY};
+    background-color: {BG_SECONDARY};
+    color: {TEXT_PRIMARY};
     border: none;
     border-radius: 4px;
     padding: 8px;
     font-size: 14px;
 }}
-QTextEdit#promptInput {{
-    background-color: {g.INPUT_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.INPUT_BORDER};
+QPlainTextEdit#promptInput {{
+    background-color: {glass_INPUT_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_INPUT_BORDER};
     border-radius: 18px;
     padding: 10px 16px;
     font-size: 14px;
     selection-background-color: rgba(48, 209, 88, 0.25);
 }}
-QTextEdit#promptInput:focus {{
+QPlainTextEdit#promptInput:focus {{
     border: 1px solid rgba(48, 209, 88, 0.35);
 }}
+QTextEdit#activityFeed, QPlainTextEdit#agentList {{
+    background: rgba(255, 255, 255, 0.03);
+    font-family: 'SF Mono', 'JetBrains Mono', 'Fira Code', monospace;
+    border: 1px solid {BORDER};
+    border-radius: 8px;
+}}
+QTextEdit#activityFeed {{
+    color: {TEXT_PRIMARY};
+    font-size: 11px;
+    padding: 6px;
+}}
+QPlainTextEdit#agentList {{
+    color: {TEXT_SECONDARY};
+    font-size: 10px;
+    padding: 4px;
+}}
 
 /* ---- Buttons (glass pills) ---- */
 QPushButton {{
-    background-color: {g.BTN_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.BTN_BORDER};
+    background-color: {glass_BTN_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_BTN_BORDER};
     border-radius: 18px;
     padding: 8px 18px;
     font-size: 13px;
 }}
 QPushButton:hover {{
-    background-color: {g.BTN_BG_HOVER};
-    color: {theme.TEXT_PRIMARY};
+    background-color: {glass_BTN_BG_HOVER};
+    color: {TEXT_PRIMARY};
     border-color: rgba(255, 255, 255, 0.16);
 }}
 QPushButton:pressed {{
-    background-color: {g.BTN_BG_PRESSED};
+    background-color: {glass_BTN_BG_PRESSED};
 }}
 QPushButton#sendBtn {{
     background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
@@ -362,43 +444,43 @@ QPushButton#sendBtn:pressed {{
     border: 1px solid rgba(0, 0, 0, 0.12);
 }}
 QPushButton#attachBtn {{
-    background-color: {g.BTN_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.BTN_BORDER};
+    background-color: {glass_BTN_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_BTN_BORDER};
     border-radius: 18px;
     padding: 8px 10px;
     font-size: 16px;
     font-weight: bold;
 }}
 QPushButton#attachBtn:hover {{
-    background-color: {g.BTN_BG_HOVER};
+    background-color: {glass_BTN_BG_HOVER};
     border-color: rgba(255, 255, 255, 0.16);
 }}
 QPushButton#micBtn {{
-    background-color: {g.BTN_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.BTN_BORDER};
+    background-color: {glass_BTN_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_BTN_BORDER};
     border-radius: 8px;
     padding: 8px 12px;
 }}
 QPushButton#micBtn:hover {{
-    background-color: {g.BTN_BG_HOVER};
+    background-color: {glass_BTN_BG_HOVER};
     border-color: rgba(255, 255, 255, 0.16);
 }}
 QPushButton#speakerBtn {{
-    background-color: {g.BTN_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.BTN_BORDER};
+    background-color: {glass_BTN_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_BTN_BORDER};
     border-radius: 8px;
     padding: 8px 12px;
 }}
 QPushButton#speakerBtn:hover {{
-    background-color: {g.BTN_BG_HOVER};
+    background-color: {glass_BTN_BG_HOVER};
     border-color: rgba(255, 255, 255, 0.16);
 }}
 QPushButton#jumpToBottom {{
     background-color: rgba(255, 255, 255, 0.08);
-    color: {theme.TEXT_SECONDARY};
+    color: {TEXT_SECONDARY};
     border: 1px solid rgba(255, 255, 255, 0.10);
     border-radius: 14px;
     padding: 5px 16px;
@@ -407,12 +489,22 @@ QPushButton#jumpToBottom {{
 }}
 QPushButton#jumpToBottom:hover {{
     background-color: rgba(255, 255, 255, 0.14);
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
+}}
+
+/* ---- Header Bar ---- */
+HeaderStatusBar {{
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(10, 10, 10, 0.95),
+        stop:0.4 rgba(18, 18, 18, 0.95),
+        stop:0.6 rgba(14, 14, 14, 0.95),
+        stop:1 rgba(10, 10, 10, 0.95));
+    border-bottom: 1px solid rgba(255, 255, 255, 0.06);
 }}
 
 /* ---- Progress Bar ---- */
 QProgressBar {{
-    background-color: {theme.BG_INPUT};
+    background-color: {BG_INPUT};
     border: none;
     border-radius: 4px;
     height: 8px;
@@ -421,48 +513,135 @@ QProgressBar {{
 }}
 QProgressBar::chunk {{
     background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 {theme.ACCENT_GREEN}, stop:1 rgba(48, 209, 88, 0.55));
+        stop:0 {ACCENT_GREEN}, stop:1 rgba(48, 209, 88, 0.55));
     border-radius: 4px;
 }}
 
 /* ---- Group Box ---- */
 QGroupBox {{
-    background-color: {theme.BG_SECONDARY};
-    border: 1px solid {theme.BORDER};
+    background-color: {BG_SECONDARY};
+    border: 1px solid {BORDER};
     border-radius: 12px;
     margin-top: 14px;
     padding: 16px 12px 12px 12px;
     font-size: 12px;
-    color: {theme.TEXT_SECONDARY};
+    color: {TEXT_SECONDARY};
 }}
 QGroupBox::title {{
     subcontrol-origin: margin;
     subcontrol-position: top left;
     padding: 2px 8px;
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     font-weight: 600;
     letter-spacing: 0.3px;
 }}
 
 /* ---- Labels ---- */
 QLabel {{
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
 }}
 QLabel#dimLabel {{
-    color: {theme.TEXT_DIM};
+    color: {TEXT_DIM};
     font-size: 11px;
 }}
 QLabel#headerLabel {{
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     font-size: 16px;
     font-weight: 600;
     letter-spacing: -0.2px;
 }}
 QLabel#secondaryLabel {{
-    color: {theme.TEXT_SECONDARY};
+    color: {TEXT_SECONDARY};
     font-size: 12px;
 }}
 
+/* ---- Chat Panel ---- */
+QWidget#chatContainer {{
+    background: {BG_PRIMARY};
+}}
+
+/* ---- Chat Bubbles (role/sentiment set as dynamic properties) ---- */
+ChatMessageWidget {{
+    border-left: none;
+    border-radius: 12px;
+    padding: 0px;
+    margin: 0px;
+}}
+ChatMessageWidget[role="user"] {{
+    background-color: rgba(255, 255, 255, 0.03);
+}}
+ChatMessageWidget[role="assistant"] {{
+    background-color: {BUBBLE_AI};
+    border-left: 2px solid {SENTIMENT_NEUTRAL};
+}}
+ChatMessageWidget[role="assistant"][sentiment="positive"] {{
+    border-left: 2px solid {SENTIMENT_POSITIVE};
+}}
+ChatMessageWidget[role="assistant"][sentiment="negative"] {{
+    border-left: 2px solid {SENTIMENT_NEGATIVE};
+}}
+ChatMessageWidget[role="system"] {{
+    background-color: {BG_SECONDARY};
+}}
+QLabel#msgRole {{
+    font-weight: bold;
+    font-size: 12px;
+    background: transparent;
+    border: none;
+}}
+ChatMessageWidget[role="user"] QLabel#msgRole {{
+    color: #FFFFFF;
+}}
+ChatMessageWidget[role="assistant"] QLabel#msgRole {{
+    color: {ACCENT_GREEN};
+}}
+ChatMessageWidget[role="system"] QLabel#msgRole {{
+    color: {TEXT_SECONDARY};
+}}
+QLabel#msgTs {{
+    color: {TEXT_DIM};
+    font-size: 11px;
+    background: transparent;
+    border: none;
+}}
+QLabel#msgBody {{
+    color: {TEXT_PRIMARY};
+    font-size: 14px;
+    background: transparent;
+    border: none;
+    line-height: 1.5;
+}}
+QWidget#msgAttachments {{
+    background: transparent;
+}}
+FooterStatusBar {{
+    background: rgba(10, 10, 10, 0.90);
+    border-top: 1px solid rgba(255, 255, 255, 0.06);
+}}
+QLabel#serviceDot {{
+    color: {TEXT_DIM};
+    font-size: 11px;
+    background: transparent;
+    border: none;
+}}
+QLabel#serviceDot[state="connected"] {{
+    color: {ACCENT_GREEN};
+}}
+QLabel#serviceDot[state="offline"] {{
+    color: {ACCENT_RED};
+}}
+QWidget#inputSideButtons {{
+    background: transparent;
+}}
+QLabel#msgChip {{
+    background: rgba(255,255,255,0.08);
+    color: {TEXT_SECONDARY};
+    font-size: 12px;
+    border: 1px solid rgba(255,255,255,0.12);
+    border-radius: 6px;
+    padding: 3px 8px;
+}}
+
 /* ---- Scroll Bars (ultra-thin) ---- */
 QScrollBar:vertical {{
     background: transparent;
@@ -486,13 +665,13 @@ QScrollBar:horizontal {{
 
 /* ---- Tab Widget (underline style) ---- */
 QTabWidget::pane {{
-    background: {theme.BG_SECONDARY};
+    background: {BG_SECONDARY};
     border: none;
-    border-top: 1px solid {theme.BORDER};
+    border-top: 1px solid {BORDER};
 }}
 QTabBar::tab {{
     background: transparent;
-    color: {theme.TEXT_SECONDARY};
+    color: {TEXT_SECONDARY};
     padding: 6px 10px;
     border: none;
     border-bottom: 2px solid transparent;
@@ -502,48 +681,68 @@ QTabBar::tab {{
 }}
 QTabBar::tab:selected {{
     background: transparent;
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     font-weight: 600;
-    border-bottom: 2px solid {theme.ACCENT_GREEN};
+    border-bottom: 2px solid {ACCENT_GREEN};
 }}
 QTabBar::tab:hover:!selected {{
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     border-bottom: 2px solid rgba(255, 255, 255, 0.15);
 }}
 
 /* ---- Status Bar ---- */
 QStatusBar {{
-    background: {theme.BG_SECONDARY};
-    color: {theme.TEXT_DIM};
+    background: {BG_SECONDARY};
+    color: {TEXT_DIM};
     font-size: 11px;
-    border-top: 1px solid {theme.BORDER};
+    border-top: 1px solid {BORDER};
 }}
 
 /* ---- Combo / Check ---- */
 QComboBox {{
-    background-color: {g.INPUT_BG};
-    color: {theme.TEXT_PRIMARY};
-    border: 1px solid {g.INPUT_BORDER};
+    background-color: {glass_INPUT_BG};
+    color: {TEXT_PRIMARY};
+    border: 1px solid {glass_INPUT_BORDER};
     border-radius: 10px;
     padding: 6px 12px;
 }}
 QCheckBox {{
-    color: {theme.TEXT_PRIMARY};
+    color: {TEXT_PRIMARY};
     spacing: 8px;
 }}
 QCheckBox::indicator {{
     width: 16px;
     height: 16px;
-    border: 1px solid {theme.BORDER};
+    border: 1px solid {BORDER};
     border-radius: 4px;
-    background: {g.INPUT_BG};
+    background: {glass_INPUT_BG};
 }}
 QCheckBox::indicator:checked {{
-    background: {theme.TEXT_PRIMARY};
-    border-color: {theme.TEXT_PRIMARY};
+    background: {TEXT_PRIMARY};
+    border-color: {TEXT_PRIMARY};
 }}
 """
 
+_THEME_KEYS = frozenset(
+    name for _, name, _, _ in string.Formatter().parse(_STYLE_TEMPLATE)
+    if name and not name.startswith("glass_")
+)
+_GLASS_VALUES = {
+    f"glass_{k}": v for k, v in vars(Glass).items() if not k.startswith("_")
+}
+
+
+@functools.lru_cache(maxsize=8)
+def build_stylesheet(theme: type = Theme) -> str:
+    """Build an Apple-style monochrome Qt stylesheet from a theme class.
+
+    Cached per theme class; call ``build_stylesheet.cache_clear()`` after
+    mutating a theme's attributes at runtime.
+    """
+    values = {k: getattr(theme, k) for k in _THEME_KEYS}
+    values.update(_GLASS_VALUES)
+    return _STYLE_TEMPLATE.format_map(values)
+
 
 # Global stylesheet
 DARK_STYLESHEET = build_stylesheet(Theme)
@@ -553,22 +752,24 @@ DARK_STYLESHEET = build_stylesheet(Theme)
 # ChatMessage -- data class for a single message
 # ===================================================================
 
+@dataclass(slots=True, frozen=True, eq=True, unsafe_hash=False)
 class ChatMessage:
-    """Data for a single chat message."""
+    """Data for a single chat message (immutable, no per-instance __dict__)."""
 
-    def __init__(
-        self,
-        role: str,          # "user" | "assistant" | "system"
-        text: str,
-        sentiment: str = "neutral",  # positive | negative | neutral
-        timestamp: Optional[float] = None,
-        attachments: Optional[List[Dict]] = None,
-    ):
-        self.role = role
-        self.text = text
-        self.sentiment = sentiment
-        self.timestamp = timestamp or time.time()
-        self.attachments: List[Dict] = attachments or []
+    # Frozen would generate a field hash, but attachments hold dicts
+    __hash__ = None  # type: ignore[assignment]
+
+    role: str                       # "user" | "assistant" | "system"
+    text: str
+    sentiment: str = "neutral"      # positive | negative | neutral
+    timestamp: float = field(default_factory=time.time)
+    attachments: Tuple[Dict, ...] = ()
+    # "HH:MM" header text, formatted once so recycled bubbles reuse it
+    time_label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        lt = time.localtime(self.timestamp)
+        object.__setattr__(self, "time_label", f"{lt.tm_hour:02d}:{lt.tm_min:02d}")
 
 
 # ===================================================================
@@ -576,105 +777,97 @@ class ChatMessage:
 # ===================================================================
 
 class ChatMessageWidget(QWidget if _QT_AVAILABLE else object):
-    """A single chat message rendered as a dark bubble with sentiment border."""
+    """A single chat message rendered as a dark bubble with sentiment border.
+
+    Bubbles can be recycled via :meth:`reset` so ChatPanel can keep a pool
+    instead of constructing a new widget tree per message.
+    """
+
+    _ROLE_LABELS = {"user": "You", "assistant": "Kait", "system": "System"}
 
     def __init__(self, message: "ChatMessage", parent: Any = None):
         if not _QT_AVAILABLE:
             return
         super().__init__(parent)
-        t = Theme
-
-        # Determine styling based on role
-        if message.role == "user":
-            bg = "rgba(255, 255, 255, 0.03)"
-            role_label = "You"
-            role_color = "#FFFFFF"
-            border_left = "none"
-        elif message.role == "assistant":
-            bg = t.BUBBLE_AI
-            role_label = "Kait"
-            role_color = t.ACCENT_GREEN
-            sentiment_colors = {
-                "positive": t.SENTIMENT_POSITIVE,
-                "negative": t.SENTIMENT_NEGATIVE,
-                "neutral": t.SENTIMENT_NEUTRAL,
-            }
-            border_left = f"2px solid {sentiment_colors.get(message.sentiment, t.SENTIMENT_NEUTRAL)}"
-        else:
-            bg = t.BG_SECONDARY
-            role_label = "System"
-            role_color = t.TEXT_SECONDARY
-            border_left = "none"
-
-        ts = datetime.fromtimestamp(message.timestamp).strftime("%H:%M")
-
-        self.setStyleSheet(
-            f"ChatMessageWidget {{ "
-            f"background-color: {bg}; "
-            f"border-left: {border_left}; "
-            f"border-radius: 12px; "
-            f"padding: 0px; "
-            f"margin: 0px; "
-            f"}}"
-        )
+        self.setObjectName("chatBubble")
+        # Plain QWidget subclasses only paint a stylesheet background with this
+        self.setAttribute(_WA_STYLED_BACKGROUND, True)
+        self.message: Optional[ChatMessage] = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(14, 10, 14, 10)
         layout.setSpacing(5)
 
-        # Header row: role + timestamp
+        # Header row: role + timestamp (left-packed via alignment, no spacer)
         header = QHBoxLayout()
         header.setSpacing(8)
+        header.setAlignment(_ALIGN_LEFT)
 
-        role_lbl = QLabel(role_label)
-        role_lbl.setStyleSheet(
-            f"color: {role_color}; font-weight: bold; font-size: 12px; "
-            f"background: transparent; border: none;"
-        )
-        header.addWidget(role_lbl)
+        self.role_label = QLabel()
+        self.role_label.setObjectName("msgRole")
+        header.addWidget(self.role_label)
 
-        ts_lbl = QLabel(ts)
-        ts_lbl.setStyleSheet(
-            f"color: {t.TEXT_DIM}; font-size: 11px; "
-            f"background: transparent; border: none;"
-        )
-        header.addWidget(ts_lbl)
-        header.addStretch()
+        self._ts_lbl = QLabel()
+        self._ts_lbl.setObjectName("msgTs")
+        header.addWidget(self._ts_lbl)
         layout.addLayout(header)
 
         # Attachment chips (shown before body text)
+        self._att_row = QWidget()
+        self._att_row.setObjectName("msgAttachments")
+        self._att_layout = QHBoxLayout(self._att_row)
+        self._att_layout.setContentsMargins(0, 0, 0, 0)
+        self._att_layout.setSpacing(6)
+        self._att_row.setVisible(False)
+        layout.addWidget(self._att_row)
+
+        # Message body
+        self.body_label = QLabel()
+        self.body_label.setObjectName("msgBody")
+        self.body_label.setWordWrap(True)
+        self.body_label.setTextInteractionFlags(_TEXT_SELECTABLE)
+        layout.addWidget(self.body_label)
+
+        self.reset(message)
+
+    def reset(self, message: "ChatMessage") -> None:
+        """Re-populate this bubble with *message* (used for recycling).
+
+        Styling comes from the global stylesheet via the ``role`` and
+        ``sentiment`` dynamic properties; only a re-polish is needed.
+        """
+        if not _QT_AVAILABLE:
+            return
+        self.message = message
+        role = message.role if message.role in self._ROLE_LABELS else "system"
+        self.setProperty("role", role)
+        self.setProperty("sentiment", message.sentiment)
+        style = self.style()
+        for w in (self, self.role_label):
+            style.unpolish(w)
+            style.polish(w)
+
+        self.role_label.setText(self._ROLE_LABELS[role])
+        self._ts_lbl.setText(message.time_label)
+
+        # Rebuild attachment chips (rare; most messages have none)
+        while self._att_layout.count():
+            item = self._att_layout.takeAt(0)
+            w = item.widget()
+            if w:
+                w.deleteLater()
         if message.attachments:
-            att_row = QHBoxLayout()
-            att_row.setSpacing(6)
             for att in message.attachments:
                 name = att.get("name", "file")
                 size = att.get("size", "")
                 label_text = f"  {name}  ({size})" if size else f"  {name}"
                 chip = QLabel(label_text)
-                chip.setStyleSheet(
-                    f"background: rgba(255,255,255,0.08); "
-                    f"color: {t.TEXT_SECONDARY}; font-size: 12px; "
-                    f"border: 1px solid rgba(255,255,255,0.12); "
-                    f"border-radius: 6px; padding: 3px 8px;"
-                )
-                att_row.addWidget(chip)
-            att_row.addStretch()
-            layout.addLayout(att_row)
+                chip.setObjectName("msgChip")
+                self._att_layout.addWidget(chip)
+            self._att_layout.addStretch()
+        self._att_row.setVisible(bool(message.attachments))
 
-        # Message body
-        body = QLabel(message.text)
-        body.setWordWrap(True)
-        body.setTextInteractionFlags(
-            Qt.TextInteractionFlag.TextSelectableByMouse
-            if hasattr(Qt, "TextInteractionFlag")
-            else Qt.TextSelectableByMouse
-        )
-        body.setStyleSheet(
-            f"color: {t.TEXT_PRIMARY}; font-size: 14px; "
-            f"background: transparent; border: none; "
-            f"line-height: 1.5;"
-        )
-        layout.addWidget(body)
+        self.body_label.setText(message.text)
 
 
 # ===================================================================
@@ -684,6 +877,16 @@ class ChatMessageWidget(QWidget if _QT_AVAILABLE else object):
 class ChatPanel(QWidget if _QT_AVAILABLE else object):
     """Scrollable chat view with message bubbles, streaming, and jump-to-bottom."""
 
+    # Bubbles kept in the layout; the rest are recycled, their ChatMessage
+    # parked, and their height folded into a top or bottom spacer so the
+    # scroll range still reflects the whole history.  Scrolling into a
+    # spacer rehydrates a batch and parks as many from the other end.
+    _MAX_LIVE_BUBBLES = 150
+    _BUBBLE_POOL_MAX = 32
+    _REHYDRATE_BATCH = 30
+    # Height assumed for messages that never had a widget (bulk loads).
+    _EST_BUBBLE_HEIGHT = 64
+
     def __init__(self, parent: Any = None, theme: type = Theme):
         if not _QT_AVAILABLE:
             return
@@ -691,18 +894,38 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
         self._theme = theme
         self._messages: List[ChatMessage] = []
         self._streaming = False
-        self._stream_tokens: List[str] = []
         self._stream_prefix = "Kait"
         self._streaming_widget: Optional[ChatMessageWidget] = None
         self._streaming_body: Optional[QLabel] = None
         self._auto_scroll = True
+        self._prev_at_bottom: Optional[bool] = None
+        self._last_range_max = -1
         self._synced_active = False
         self._synced_timer: Optional[QTimer] = None
         self._synced_words: List[str] = []
         self._synced_word_idx = 0
         self._synced_sentiment = "neutral"
         self._synced_on_complete: Optional[Callable] = None
-        self._flush_scheduled: bool = False
+        # Grown in place per token (amortized O(1) append in CPython), so
+        # no per-frame re-join of a growing token list.
+        self._stream_text = ""
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_stream_display)
+        # One persistent timer coalesces scroll-to-bottom requests
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(16)
+        self._scroll_timer.timeout.connect(self._scroll_to_bottom)
+        self._bubble_pool: Deque[ChatMessageWidget] = deque()
+        # Parked above the live window (oldest first) ...
+        self._evicted: List[ChatMessage] = []
+        self._evicted_heights: List[int] = []
+        # ... and below it, after scrolling back up (oldest first)
+        self._below: List[ChatMessage] = []
+        self._below_heights: List[int] = []
+        self._rehydrating = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -711,23 +934,12 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
         # Scroll area containing message widgets
         self._scroll = QScrollArea()
         self._scroll.setWidgetResizable(True)
-        self._scroll.setFrameStyle(QFrame.Shape.NoFrame if hasattr(QFrame, "Shape") else QFrame.NoFrame)
-        self._scroll.setHorizontalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            if hasattr(Qt, "ScrollBarPolicy")
-            else Qt.ScrollBarAlwaysOff
-        )
+        self._scroll.setFrameStyle(_FRAME_NOFRAME)
+        self._scroll.setHorizontalScrollBarPolicy(_SCROLLBAR_OFF)
         self._scroll.verticalScrollBar().rangeChanged.connect(self._on_range_changed)
         self._scroll.verticalScrollBar().valueChanged.connect(self._on_scroll_moved)
 
-        self._container = QWidget()
-        self._container.setStyleSheet(f"background: {theme.BG_PRIMARY};")
-        self._msg_layout = QVBoxLayout(self._container)
-        self._msg_layout.setContentsMargins(10, 10, 10, 10)
-        self._msg_layout.setSpacing(10)
-        self._msg_layout.addStretch()
-
-        self._scroll.setWidget(self._container)
+        self._build_container()
         layout.addWidget(self._scroll)
 
         # Jump-to-bottom button (hidden by default)
@@ -735,10 +947,8 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
         self._jump_btn.setObjectName("jumpToBottom")
         self._jump_btn.setFixedHeight(28)
         self._jump_btn.setVisible(False)
-        self._jump_btn.clicked.connect(self._scroll_to_bottom)
-        layout.addWidget(self._jump_btn, alignment=(
-            Qt.AlignmentFlag.AlignCenter if hasattr(Qt, "AlignmentFlag") else Qt.AlignCenter
-        ))
+        self._jump_btn.clicked.connect(self._jump_to_latest)
+        layout.addWidget(self._jump_btn, alignment=_ALIGN_CENTER)
 
     # --- public API ----------------------------------------------------------
 
@@ -751,10 +961,45 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
         else:
             msg = ChatMessage(str(msg_or_role), text, sentiment)
         self._messages.append(msg)
-        widget = ChatMessageWidget(msg)
-        self._msg_layout.insertWidget(self._msg_layout.count() - 1, widget)
-        if self._auto_scroll:
-            QTimer.singleShot(10, self._scroll_to_bottom)
+        if self._below:
+            # Scrolled back: leave the viewport where the user is reading
+            self._park_below([msg])
+            return
+        self._insert_bubble(self._make_bubble(msg))
+        self._schedule_scroll()
+
+    def add_messages(self, msgs: List[ChatMessage]) -> None:
+        """Add many messages at once (e.g. history replay) with one layout pass.
+
+        Messages beyond the live-bubble cap are parked without ever getting
+        a widget; they are rehydrated on scroll like evicted ones.
+        """
+        if not _QT_AVAILABLE or not msgs:
+            return
+        self._messages.extend(msgs)
+        if self._below:
+            self._park_below(msgs)
+            return
+        live = self._live_count()
+        overflow = live + len(msgs) - self._MAX_LIVE_BUBBLES
+        if overflow > 0:
+            # Park the live bubbles that will scroll out first, so that
+            # _evicted stays in chronological order
+            self._evict_oldest(min(overflow, live))
+        parked = len(msgs) - self._MAX_LIVE_BUBBLES
+        if parked > 0:
+            self._evicted.extend(msgs[:parked])
+            est = self._EST_BUBBLE_HEIGHT + self._msg_layout.spacing()
+            self._evicted_heights.extend([est] * parked)
+            self._set_top_spacer(self._top_spacer.height() + est * parked)
+            msgs = msgs[parked:]
+        self._container.setUpdatesEnabled(False)
+        try:
+            for msg in msgs:
+                self._insert_bubble(self._make_bubble(msg))
+        finally:
+            self._container.setUpdatesEnabled(True)
+        self._schedule_scroll()
 
     def begin_streaming(self, prefix: str = "Kait") -> None:
         """Start a streaming assistant message.  Tokens are appended via append_token()."""
@@ -762,40 +1007,40 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
             return
         t = self._theme
         self._streaming = True
-        self._stream_tokens = []
+        self._stream_text = ""
         self._stream_prefix = prefix
 
+        # The live bubble has to sit after everything parked below
+        if self._below:
+            self._jump_to_latest()
+
         # Create a widget for the streaming bubble
         placeholder = ChatMessage("assistant", "\u2588", "neutral")
-        widget = ChatMessageWidget(placeholder)
+        widget = self._make_bubble(placeholder)
         self._streaming_widget = widget
+        self._streaming_body = widget.body_label
 
-        # Find the body QLabel inside the widget so we can update it
-        for child in widget.findChildren(QLabel):
-            if child.text() == "\u2588":
-                self._streaming_body = child
-                break
-
-        self._msg_layout.insertWidget(self._msg_layout.count() - 1, widget)
-        if self._auto_scroll:
-            QTimer.singleShot(10, self._scroll_to_bottom)
+        self._insert_bubble(widget)
+        self._schedule_scroll()
 
     def append_token(self, token: str) -> None:
         """Append a token to the current streaming message (batched ~60fps)."""
         if not _QT_AVAILABLE or not self._streaming:
             return
-        self._stream_tokens.append(token)
-        if not self._flush_scheduled:
-            self._flush_scheduled = True
-            QTimer.singleShot(16, self._flush_stream_display)
+        self._stream_text += token
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def stream_text(self) -> str:
+        """Return the text accumulated so far for the current stream."""
+        return self._stream_text
 
     def _flush_stream_display(self) -> None:
         """Batch-update the streaming label instead of per-token repaints."""
-        self._flush_scheduled = False
         if not self._streaming:
             return
         if self._streaming_body is not None:
-            self._streaming_body.setText("".join(self._stream_tokens) + "\u2588")
+            self._streaming_body.setText(self._stream_text + "\u2588")
         if self._auto_scroll:
             self._scroll_to_bottom()
 
@@ -808,8 +1053,8 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
         if not _QT_AVAILABLE:
             return ""
         self._streaming = False
-        self._flush_scheduled = False
-        full_text = "".join(self._stream_tokens)
+        self._flush_timer.stop()
+        full_text = self._stream_text
         shown = display_text or full_text
 
         # Replace the cursor block with final text (or summary)
@@ -817,13 +1062,16 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
             self._streaming_body.setText(shown)
 
         # Record as a proper message
+        msg = None
         if full_text:
             msg = ChatMessage("assistant", shown, sentiment)
             self._messages.append(msg)
+        if self._streaming_widget is not None:
+            self._streaming_widget.message = msg
 
         self._streaming_widget = None
         self._streaming_body = None
-        self._stream_tokens = []
+        self._stream_text = ""
         return full_text
 
     def begin_synced_reveal(
@@ -878,35 +1126,274 @@ class ChatPanel(QWidget if _QT_AVAILABLE else object):
     def clear_chat(self) -> None:
         if not _QT_AVAILABLE:
             return
-        # Remove all message widgets
-        while self._msg_layout.count() > 1:
-            item = self._msg_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        # Swap in a fresh container; the scroll area destroys the old one
+        # (and every bubble in it, pooled ones included) in a single pass
+        # instead of shuffling the layout item-by-item.
+        self._bubble_pool.clear()
+        self._build_container()
         self._messages.clear()
+        self._evicted.clear()
+        self._evicted_heights.clear()
+        self._below.clear()
+        self._below_heights.clear()
         self._streaming = False
+        self._flush_timer.stop()
+        self._stream_text = ""
+        self._streaming_widget = None
+        self._streaming_body = None
+
+    def _build_container(self) -> None:
+        """Create the message container + layout and install it in the scroll."""
+        self._container = QWidget()
+        # Background comes from the global ``QWidget#chatContainer`` rule; a
+        # selectorless sheet here would override every bubble's own rules.
+        self._container.setObjectName("chatContainer")
+        self._msg_layout = QVBoxLayout(self._container)
+        self._msg_layout.setContentsMargins(10, 10, 10, 10)
+        self._msg_layout.setSpacing(10)
+        # Pin bubbles to the top without a trailing stretch
+        self._msg_layout.setAlignment(_ALIGN_TOP)
+        # Stand-ins for parked bubbles above (index 0) and below (last
+        # index) the live window
+        self._top_spacer = QWidget()
+        self._bottom_spacer = QWidget()
+        for spacer in (self._top_spacer, self._bottom_spacer):
+            spacer.setFixedHeight(0)
+            spacer.setVisible(False)
+            self._msg_layout.addWidget(spacer)
+        self._scroll.setWidget(self._container)
 
     def set_theme(self, theme: type) -> None:
         self._theme = theme
 
+    # --- bubble pooling ------------------------------------------------------
+
+    def _make_bubble(self, msg: ChatMessage) -> ChatMessageWidget:
+        """Return a bubble for *msg*, reusing a pooled widget when possible."""
+        if self._bubble_pool:
+            widget = self._bubble_pool.pop()
+            widget.reset(msg)
+            return widget
+        return ChatMessageWidget(msg)
+
+    def _recycle_bubble(self, widget: Any) -> None:
+        """Detach *widget* and keep it for reuse (or delete if pool is full)."""
+        widget.hide()
+        if isinstance(widget, ChatMessageWidget) and len(self._bubble_pool) < self._BUBBLE_POOL_MAX:
+            widget.message = None
+            self._bubble_pool.append(widget)
+        else:
+            widget.deleteLater()
+
+    def _live_count(self) -> int:
+        """Number of bubbles in the layout (excluding the two spacers)."""
+        return self._msg_layout.count() - 2
+
+    def _insert_bubble(self, widget: ChatMessageWidget) -> None:
+        """Append *widget* to the message list and enforce the cap."""
+        self._msg_layout.insertWidget(self._msg_layout.count() - 1, widget)
+        widget.show()
+        # Evict the oldest bubbles once the live count exceeds the cap
+        self._evict_oldest(self._live_count() - self._MAX_LIVE_BUBBLES)
+
+    def _evict_oldest(self, count: int) -> None:
+        """Park up to *count* of the oldest live bubbles behind the top spacer."""
+        evicted_h = 0
+        for _ in range(min(count, self._live_count())):
+            item = self._msg_layout.itemAt(1)
+            w = item.widget() if item is not None else None
+            if w is None or w is self._streaming_widget:
+                break
+            self._msg_layout.takeAt(1)
+            if getattr(w, "message", None) is not None:
+                h = (w.height() or w.sizeHint().height()) + self._msg_layout.spacing()
+                self._evicted.append(w.message)
+                self._evicted_heights.append(h)
+                evicted_h += h
+            self._recycle_bubble(w)
+        if evicted_h:
+            self._set_top_spacer(self._top_spacer.height() + evicted_h)
+
+    def _evict_newest(self, count: int) -> None:
+        """Park up to *count* of the newest live bubbles behind the bottom spacer.
+
+        Stops at a bubble that is still streaming; it is parked once finished.
+        """
+        msgs: List[ChatMessage] = []
+        heights: List[int] = []
+        for _ in range(min(count, self._live_count())):
+            idx = self._msg_layout.count() - 2
+            w = self._msg_layout.itemAt(idx).widget()
+            if w is None or w is self._streaming_widget:
+                break
+            self._msg_layout.takeAt(idx)
+            if getattr(w, "message", None) is not None:
+                msgs.append(w.message)
+                h = (w.height() or w.sizeHint().height()) + self._msg_layout.spacing()
+                heights.append(h)
+            self._recycle_bubble(w)
+        if msgs:
+            msgs.reverse()
+            heights.reverse()
+            self._below[:0] = msgs
+            self._below_heights[:0] = heights
+            self._set_bottom_spacer(self._bottom_spacer.height() + sum(heights))
+
+    def _park_below(self, msgs: List[ChatMessage]) -> None:
+        """Park new messages behind the bottom spacer without widgets."""
+        est = self._EST_BUBBLE_HEIGHT + self._msg_layout.spacing()
+        self._below.extend(msgs)
+        self._below_heights.extend([est] * len(msgs))
+        self._set_bottom_spacer(self._bottom_spacer.height() + est * len(msgs))
+
+    def _set_top_spacer(self, height: int) -> None:
+        """Resize the spacer standing in for evicted bubbles."""
+        height = max(0, height) if self._evicted else 0
+        self._top_spacer.setFixedHeight(height)
+        self._top_spacer.setVisible(height > 0)
+
+    def _set_bottom_spacer(self, height: int) -> None:
+        """Resize the spacer standing in for bubbles parked below the view."""
+        height = max(0, height) if self._below else 0
+        self._bottom_spacer.setFixedHeight(height)
+        self._bottom_spacer.setVisible(height > 0)
+
+    def _rehydrate_older(self) -> None:
+        """Re-insert a batch of evicted messages at the top of the view.
+
+        As many of the newest bubbles are parked below, so the live count
+        stays within the cap.
+        """
+        if not self._evicted or self._rehydrating:
+            return
+        self._rehydrating = True
+        self._hold_scroll()
+        sb = self._scroll.verticalScrollBar()
+        from_bottom = sb.maximum() - sb.value()
+        batch = self._evicted[-self._REHYDRATE_BATCH:]
+        del self._evicted[-self._REHYDRATE_BATCH:]
+        freed = sum(self._evicted_heights[-self._REHYDRATE_BATCH:])
+        del self._evicted_heights[-self._REHYDRATE_BATCH:]
+        self._set_top_spacer(self._top_spacer.height() - freed)
+        for i, msg in enumerate(batch):
+            widget = self._make_bubble(msg)
+            self._msg_layout.insertWidget(1 + i, widget)
+            widget.show()
+        self._evict_newest(self._live_count() - self._MAX_LIVE_BUBBLES)
+        # Keep the viewport anchored on what the user was reading
+        QTimer.singleShot(0, lambda: self._finish_rehydrate(from_bottom))
+
+    def _rehydrate_newer(self) -> None:
+        """Re-insert a batch of messages parked below, evicting from the top.
+
+        Evicted heights move into the top spacer, so the scroll position
+        needs no correction.
+        """
+        if not self._below or self._rehydrating:
+            return
+        self._rehydrating = True
+        self._hold_scroll()
+        batch = self._below[:self._REHYDRATE_BATCH]
+        del self._below[:self._REHYDRATE_BATCH]
+        freed = sum(self._below_heights[:self._REHYDRATE_BATCH])
+        del self._below_heights[:self._REHYDRATE_BATCH]
+        self._set_bottom_spacer(self._bottom_spacer.height() - freed)
+        for msg in batch:
+            widget = self._make_bubble(msg)
+            self._msg_layout.insertWidget(self._msg_layout.count() - 1, widget)
+            widget.show()
+        self._evict_oldest(self._live_count() - self._MAX_LIVE_BUBBLES)
+        QTimer.singleShot(0, self._finish_rehydrate)
+
+    def _hold_scroll(self) -> None:
+        """Stop auto-scroll from snapping back to the latest messages.
+
+        A rehydrated batch changes the scroll range; left on, auto-scroll
+        would jump to the bottom and park the batch straight away.
+        """
+        self._auto_scroll = False
+        self._scroll_timer.stop()
+        self._last_range_max = self._scroll.verticalScrollBar().maximum()
+
+    def _finish_rehydrate(self, from_bottom: Optional[int] = None) -> None:
+        """Restore the scroll anchor once the rehydrated batch is laid out."""
+        # Still flagged while restoring, so the move does not itself
+        # rehydrate from the other spacer
+        sb = self._scroll.verticalScrollBar()
+        if from_bottom is not None:
+            sb.setValue(sb.maximum() - from_bottom)
+        self._rehydrating = False
+        # Keep filling while the viewport is still over the same spacer
+        if from_bottom is not None:
+            if self._evicted and sb.value() <= self._top_spacer.height():
+                self._rehydrate_older()
+        elif self._below and sb.value() + sb.pageStep() >= self._bottom_spacer.y():
+            self._rehydrate_newer()
+
+    def _show_latest(self, keep: int) -> None:
+        """Move the live window to the end of the history.
+
+        Everything but the last *keep* messages is parked above the window;
+        of those, the ones parked below get bubbles again.
+        """
+        if not self._below:
+            return
+        self._evict_oldest(self._live_count() - max(0, keep - len(self._below)))
+        split = max(0, len(self._below) - keep)
+        self._evicted.extend(self._below[:split])
+        self._evicted_heights.extend(self._below_heights[:split])
+        self._set_top_spacer(
+            self._top_spacer.height() + sum(self._below_heights[:split])
+        )
+        tail = self._below[split:]
+        self._below.clear()
+        self._below_heights.clear()
+        self._set_bottom_spacer(0)
+        for msg in tail:
+            widget = self._make_bubble(msg)
+            self._msg_layout.insertWidget(self._msg_layout.count() - 1, widget)
+            widget.show()
+
     # --- scrolling -----------------------------------------------------------
 
+    def _schedule_scroll(self) -> None:
+        """Scroll to the bottom on the next frame if auto-scroll is on."""
+        if self._auto_scroll and not self._scroll_timer.isActive():
+            self._scroll_timer.start()
+
     def _scroll_to_bottom(self) -> None:
         if not _QT_AVAILABLE:
             return
+        self._show_latest(self._MAX_LIVE_BUBBLES)
         sb = self._scroll.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def _jump_to_latest(self) -> None:
+        """Show the newest messages and follow new ones again."""
+        self._auto_scroll = True
+        self._scroll_to_bottom()
+
     def _on_range_changed(self, _min: int, _max: int) -> None:
-        if self._auto_scroll:
+        if _max == self._last_range_max:
+            return
+        self._last_range_max = _max
+        # Never yank the window back while the user is reading history
+        if self._auto_scroll and not self._below and not self._rehydrating:
             self._scroll_to_bottom()
 
     def _on_scroll_moved(self, value: int) -> None:
         sb = self._scroll.verticalScrollBar()
-        at_bottom = value >= sb.maximum() - 20
+        at_bottom = not self._below and value >= sb.maximum() - 20
         self._auto_scroll = at_bottom
-        self._jump_btn.setVisible(not at_bottom)
+        # Only show/hide the jump button on transitions, not every tick
+        if at_bottom != self._prev_at_bottom:
+            self._prev_at_bottom = at_bottom
+            self._jump_btn.setVisible(not at_bottom)
+        # Viewport reached a spacer: materialize the bubbles it stands for
+        if self._evicted and not at_bottom and value <= self._top_spacer.height():
+            self._rehydrate_older()
+        elif self._below and value + sb.pageStep() >= self._bottom_spacer.y():
+            self._rehydrate_newer()
 
 
 # ===================================================================
@@ -1411,15 +1898,30 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
     methods from both panels are preserved for backward compatibility.
     """
 
+    # Activity feed self-prunes beyond this many lines (blocks).
+    _FEED_MAX_BLOCKS = 2000
+
     def __init__(self, parent: Any = None):
         if not _QT_AVAILABLE:
             return
         super().__init__(parent)
         t = Theme
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 10, 12, 10)
+        # The frequently-updated status row and status text are pinned
+        # outside the scroll area, so their text changes only re-lay out
+        # this panel's outer layout rather than the scrolled content.
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(12, 10, 12, 10)
+        outer.setSpacing(8)
+
+        content = QWidget()
+        layout = QVBoxLayout(content)
+        layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
+        self._scroll = QScrollArea()
+        self._scroll.setWidgetResizable(True)
+        self._scroll.setFrameStyle(_FRAME_NOFRAME)
+        self._scroll.setHorizontalScrollBarPolicy(_SCROLLBAR_OFF)
 
         # --- Status row: active step + model badge ---
         status_row = QHBoxLayout()
@@ -1442,7 +1944,7 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
             f"padding: 2px 8px;"
         )
         status_row.addWidget(self._model_badge)
-        layout.addLayout(status_row)
+        outer.addLayout(status_row)
 
         # --- Pipeline Flow (kept as-is) ---
         graph_group = QGroupBox("Pipeline Flow")
@@ -1484,30 +1986,26 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
         self._activity_feed = QTextEdit()
         self._activity_feed.setReadOnly(True)
         self._activity_feed.setMaximumHeight(120)
-        self._activity_feed.setStyleSheet(
-            f"background: rgba(255, 255, 255, 0.03); color: {t.TEXT_PRIMARY}; "
-            f"font-family: 'SF Mono', 'JetBrains Mono', 'Fira Code', monospace; font-size: 11px; "
-            f"border: 1px solid {t.BORDER}; border-radius: 8px; padding: 6px;"
-        )
+        self._activity_feed.document().setMaximumBlockCount(self._FEED_MAX_BLOCKS)
+        self._activity_feed.setObjectName("activityFeed")
         activity_lay.addWidget(self._activity_feed)
 
-        self._agent_list = QTextEdit()
+        self._agent_list = QPlainTextEdit()
         self._agent_list.setReadOnly(True)
         self._agent_list.setMaximumHeight(60)
-        self._agent_list.setStyleSheet(
-            f"background: rgba(255, 255, 255, 0.03); color: {t.TEXT_SECONDARY}; "
-            f"font-family: 'SF Mono', 'JetBrains Mono', 'Fira Code', monospace; font-size: 10px; "
-            f"border: 1px solid {t.BORDER}; border-radius: 8px; padding: 4px;"
-        )
+        self._agent_list.setObjectName("agentList")
         self._agent_list.setPlainText("No agent activity yet.")
         activity_lay.addWidget(self._agent_list)
         layout.addWidget(activity_group)
 
+        self._scroll.setWidget(content)
+        outer.addWidget(self._scroll, stretch=1)
+
         # --- Status text ---
         self._status_text = QLabel("Waiting for first interaction...")
         self._status_text.setObjectName("dimLabel")
         self._status_text.setWordWrap(True)
-        layout.addWidget(self._status_text)
+        outer.addWidget(self._status_text)
 
         # Internal state for backward compat
         self._token_count = 0
@@ -1515,6 +2013,11 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
         self._provider_name = "--"
         self._latency_text = "--"
 
+        # Last text pushed to each polled widget (skip no-op repaints)
+        self._last_agent_text = "No agent activity yet."
+        self._last_badge_text = "--"
+        self._last_status_text = "Waiting for first interaction..."
+
         # Periodic health refresh from observatory
         self._health_timer = QTimer(self)
         self._health_timer.timeout.connect(self._refresh_health)
@@ -1543,7 +2046,7 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
     def update_status(self, text: str) -> None:
         """Update the status label at the bottom."""
         if _QT_AVAILABLE:
-            self._status_text.setText(text)
+            self._set_status_text(text)
 
     # --- ProcessingMonitorPanel backward-compatible API ----------------------
 
@@ -1556,6 +2059,30 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
         sb = self._activity_feed.verticalScrollBar()
         sb.setValue(sb.maximum())
 
+    def append_feed_block(self, header: str, body: str) -> None:
+        """Append a header line plus a (long) body as a single insert.
+
+        Used for full responses: one cursor insert and one scroll instead
+        of two ``append`` round-trips through the feed's layout.
+        """
+        if not _QT_AVAILABLE:
+            return
+        ts = datetime.fromtimestamp(time.time()).strftime("%H:%M:%S")
+        feed = self._activity_feed
+        feed.setUpdatesEnabled(False)
+        try:
+            cursor = QTextCursor(feed.document())
+            cursor.movePosition(_MOVE_END)
+            cursor.beginEditBlock()
+            if not feed.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"{ts}  {header}\n{body}")
+            cursor.endEditBlock()
+        finally:
+            feed.setUpdatesEnabled(True)
+        sb = feed.verticalScrollBar()
+        sb.setValue(sb.maximum())
+
     def clear_feed(self) -> None:
         """Clear the activity feed."""
         if _QT_AVAILABLE:
@@ -1594,10 +2121,12 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
         """Replace the agent activity list."""
         if not _QT_AVAILABLE:
             return
-        if entries:
-            self._agent_list.setPlainText("\n".join(entries))
-        else:
-            self._agent_list.setPlainText("No agent activity yet.")
+        text = "\n".join(entries) if entries else "No agent activity yet."
+        # Polled every tick; skip the re-layout when nothing changed
+        if text == self._last_agent_text:
+            return
+        self._last_agent_text = text
+        self._agent_list.setPlainText(text)
 
     def update_model_info(self, model: str = "--", provider: str = "--", latency: str = "--") -> None:
         """Update the model badge with model, provider, and latency."""
@@ -1607,7 +2136,10 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
         self._provider_name = provider
         self._latency_text = latency
         parts = [p for p in (model, provider, latency) if p and p != "--"]
-        self._model_badge.setText("  |  ".join(parts) if parts else "--")
+        text = "  |  ".join(parts) if parts else "--"
+        if text != self._last_badge_text:
+            self._last_badge_text = text
+            self._model_badge.setText(text)
 
     def update_source_stats(self, stats: Dict[str, int]) -> None:
         """Store source stats (shown via status text on next metrics update)."""
@@ -1616,7 +2148,7 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
         if stats:
             total = sum(stats.values())
             parts = [f"{src}: {cnt}" for src, cnt in sorted(stats.items())]
-            self._status_text.setText(f"Sources: {', '.join(parts)} (total {total})")
+            self._set_status_text(f"Sources: {', '.join(parts)} (total {total})")
 
     def update_metrics(self, metrics: Dict[str, Any]) -> None:
         """Display key metrics in the status text."""
@@ -1624,7 +2156,14 @@ class DashboardPanel(QWidget if _QT_AVAILABLE else object):
             return
         parts = [f"{k}: {v}" for k, v in metrics.items()]
         if parts:
-            self._status_text.setText("  |  ".join(parts))
+            self._set_status_text("  |  ".join(parts))
+
+    def _set_status_text(self, text: str) -> None:
+        """Set the shared status line, skipping no-op updates."""
+        if text == self._last_status_text:
+            return
+        self._last_status_text = text
+        self._status_text.setText(text)
 
     # --- Health refresh (observatory) ----------------------------------------
 
@@ -1808,9 +2347,7 @@ class ChatHistoryPanel(QWidget if _QT_AVAILABLE else object):
 
         self._session_scroll = QScrollArea()
         self._session_scroll.setWidgetResizable(True)
-        self._session_scroll.setFrameStyle(
-            QFrame.Shape.NoFrame if hasattr(QFrame, "Shape") else QFrame.NoFrame
-        )
+        self._session_scroll.setFrameStyle(_FRAME_NOFRAME)
         self._session_container = QWidget()
         self._session_layout = QVBoxLayout(self._session_container)
         self._session_layout.setContentsMargins(0, 0, 0, 0)
@@ -1862,9 +2399,7 @@ class ChatHistoryPanel(QWidget if _QT_AVAILABLE else object):
 
         self._archive_scroll = QScrollArea()
         self._archive_scroll.setWidgetResizable(True)
-        self._archive_scroll.setFrameStyle(
-            QFrame.Shape.NoFrame if hasattr(QFrame, "Shape") else QFrame.NoFrame
-        )
+        self._archive_scroll.setFrameStyle(_FRAME_NOFRAME)
         self._archive_container = QWidget()
         self._archive_layout = QVBoxLayout(self._archive_container)
         self._archive_layout.setContentsMargins(0, 0, 0, 0)
@@ -2330,10 +2865,12 @@ class ChatHistoryPanel(QWidget if _QT_AVAILABLE else object):
 # ExpandingTextEdit -- auto-growing prompt input
 # ===================================================================
 
-class ExpandingTextEdit(QTextEdit if _QT_AVAILABLE else object):
-    """Multi-line text input that grows vertically.
+class ExpandingTextEdit(QPlainTextEdit if _QT_AVAILABLE else object):
+    """Multi-line plain-text input that grows vertically.
 
-    Enter sends, Shift+Enter inserts a newline.
+    Enter sends, Shift+Enter inserts a newline.  Built on QPlainTextEdit,
+    whose line-based layout is much cheaper than QTextEdit's rich-text
+    model on long pastes.
     """
 
     submit_pressed = pyqtSignal() if _QT_AVAILABLE else None
@@ -2347,13 +2884,12 @@ class ExpandingTextEdit(QTextEdit if _QT_AVAILABLE else object):
         if not _QT_AVAILABLE:
             return
         super().__init__(parent)
-        self.setAcceptRichText(False)
         self.setTabChangesFocus(True)
         self.setAcceptDrops(True)
         self.setLineWrapMode(
-            QTextEdit.LineWrapMode.WidgetWidth
-            if hasattr(QTextEdit, "LineWrapMode")
-            else QTextEdit.WidgetWidth
+            QPlainTextEdit.LineWrapMode.WidgetWidth
+            if hasattr(QPlainTextEdit, "LineWrapMode")
+            else QPlainTextEdit.WidgetWidth
         )
         self.setWordWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
         self.setVerticalScrollBarPolicy(
@@ -2361,45 +2897,130 @@ class ExpandingTextEdit(QTextEdit if _QT_AVAILABLE else object):
             if hasattr(Qt, "ScrollBarPolicy")
             else Qt.ScrollBarAsNeeded
         )
-        self.setHorizontalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-            if hasattr(Qt, "ScrollBarPolicy")
-            else Qt.ScrollBarAlwaysOff
-        )
+        self.setHorizontalScrollBarPolicy(_SCROLLBAR_OFF)
+        # Keystrokes and drag-resizes arrive in bursts; collapse each burst
+        # into one trailing height recompute.
+        self._adjust_timer = QTimer(self)
+        self._adjust_timer.setSingleShot(True)
+        self._adjust_timer.setInterval(16)
+        self._adjust_timer.timeout.connect(self._do_adjust_height)
+        self._applied_bounds: Optional[tuple] = None
+        self._refresh_metrics()
+        # While hidden or while the top-level window is being drag-resized,
+        # height work is deferred (marked dirty) and done once afterwards.
+        self._dirty = False
+        self._resizing = False
+        self._watched_window: Any = None
+        self._resize_idle = QTimer(self)
+        self._resize_idle.setSingleShot(True)
+        self._resize_idle.setInterval(120)
+        self._resize_idle.timeout.connect(self._on_resize_idle)
         self.document().documentLayout().documentSizeChanged.connect(self._adjust_height)
         self.setSizePolicy(
             QSizePolicy.Policy.Expanding if hasattr(QSizePolicy, "Policy") else QSizePolicy.Expanding,
             QSizePolicy.Policy.Minimum if hasattr(QSizePolicy, "Policy") else QSizePolicy.Minimum,
         )
-        self._adjust_height()
+        self._do_adjust_height()
 
-        self._history: List[str] = []
+        # Ring buffer: appends drop the oldest entry once full
+        self._history: Deque[str] = deque(maxlen=self._MAX_HISTORY)
+        self._history_set: Set[str] = set()
         self._history_idx: int = -1
         self._draft: str = ""
         self._last_esc_time: float = 0.0
 
+        # Key -> handler; a handler returns True when it consumed the event.
+        self._key_handlers = {
+            _KEY_RETURN: self._handle_enter,
+            _KEY_ENTER: self._handle_enter,
+            _KEY_ESCAPE: self._handle_escape,
+            _KEY_UP: self._handle_up,
+            _KEY_DOWN: self._handle_down,
+        }
+
     # --- height management ---------------------------------------------------
 
     def _line_height(self) -> int:
-        return self.fontMetrics().lineSpacing()
+        return self._cached_line_h
 
-    def _adjust_height(self) -> None:
-        self.document().setTextWidth(self.viewport().width())
-        doc_height = int(self.document().size().height())
+    def _refresh_metrics(self) -> None:
+        """Recompute cached line height, padding and min/max heights."""
+        self._cached_line_h = self.fontMetrics().lineSpacing()
         margins = self.contentsMargins()
-        pad = margins.top() + margins.bottom() + 2 * self.frameWidth()
-        line_h = self._line_height()
-        min_h = line_h * self._MIN_LINES + pad + 10
-        max_h = line_h * self._MAX_LINES + pad + 10
-        new_h = max(min_h, min(doc_height + pad, max_h))
-        self.setMinimumHeight(min_h)
-        self.setMaximumHeight(max_h)
+        self._cached_pad = margins.top() + margins.bottom() + 2 * self.frameWidth()
+        self._min_h = self._cached_line_h * self._MIN_LINES + self._cached_pad + 10
+        self._max_h = self._cached_line_h * self._MAX_LINES + self._cached_pad + 10
+
+    def changeEvent(self, event: Any) -> None:  # noqa: N802
+        super().changeEvent(event)
+        if not hasattr(self, "_adjust_timer"):
+            return  # still inside __init__
+        if event.type() in (
+            (QEvent.Type.FontChange, QEvent.Type.StyleChange)
+            if hasattr(QEvent, "Type")
+            else (QEvent.FontChange, QEvent.StyleChange)
+        ):
+            self._refresh_metrics()
+            self._adjust_height()
+
+    def _adjust_height(self, *_args: Any) -> None:
+        """Schedule a height recompute (restarts the 16 ms window)."""
+        self._adjust_timer.start()
+
+    def _do_adjust_height(self) -> None:
+        min_h, max_h = self._min_h, self._max_h
+        if self._applied_bounds != (min_h, max_h):
+            self._applied_bounds = (min_h, max_h)
+            self.setMinimumHeight(min_h)
+            self.setMaximumHeight(max_h)
+        # The document layout pass is the expensive part; defer it
+        if self._resizing or not self.isVisible():
+            self._dirty = True
+            return
+        self._dirty = False
+        # QPlainTextDocumentLayout reports its height in wrapped lines
+        doc = self.document()
+        doc_height = int(
+            doc.size().height() * self._cached_line_h + 2 * doc.documentMargin()
+        )
+        new_h = max(min_h, min(doc_height + self._cached_pad, max_h))
         if self.height() != new_h:
             self.resize(self.width(), new_h)
 
     def resizeEvent(self, event: Any) -> None:  # noqa: N802
         super().resizeEvent(event)
-        self._adjust_height()
+        self._adjust_timer.start()
+
+    def closeEvent(self, event: Any) -> None:  # noqa: N802
+        self._adjust_timer.stop()
+        self._resize_idle.stop()
+        super().closeEvent(event)
+
+    def showEvent(self, event: Any) -> None:  # noqa: N802
+        super().showEvent(event)
+        # The top-level window is only known once we're parented and shown
+        win = self.window()
+        if win is not self and win is not self._watched_window:
+            if self._watched_window is not None:
+                self._watched_window.removeEventFilter(self)
+            win.installEventFilter(self)
+            self._watched_window = win
+        if self._dirty:
+            self._do_adjust_height()
+
+    def eventFilter(self, obj: Any, event: Any) -> bool:  # noqa: N802
+        if obj is self._watched_window and event.type() == (
+            QEvent.Type.Resize if hasattr(QEvent, "Type") else QEvent.Resize
+        ):
+            self._resizing = True
+            self._resize_idle.start()
+        return super().eventFilter(obj, event)
+
+    def _on_resize_idle(self) -> None:
+        """Window drag-resize settled: run the deferred adjustment once."""
+        self._resizing = False
+        if self._dirty:
+            self._do_adjust_height()
 
     # --- history -------------------------------------------------------------
 
@@ -2407,101 +3028,107 @@ class ExpandingTextEdit(QTextEdit if _QT_AVAILABLE else object):
         text = text.strip()
         if not text:
             return
-        if self._history and self._history[-1] == text:
-            return
-        self._history.append(text)
-        if len(self._history) > self._MAX_HISTORY:
-            self._history = self._history[-self._MAX_HISTORY:]
+        if text in self._history_set:
+            # Repeats are promoted to most-recent rather than duplicated
+            if self._history[-1] != text:
+                self._history.remove(text)
+                self._history.append(text)
+        else:
+            if len(self._history) == self._history.maxlen:
+                self._history_set.discard(self._history[0])
+            self._history.append(text)
+            self._history_set.add(text)
         self._history_idx = -1
         self._draft = ""
 
     def _cursor_on_first_line(self) -> bool:
-        cursor = self.textCursor()
-        cursor.movePosition(
-            cursor.MoveOperation.StartOfBlock if hasattr(cursor, "MoveOperation") else cursor.StartOfBlock
-        )
-        return cursor.atStart()
+        return self.textCursor().blockNumber() == 0
 
     def _cursor_on_last_line(self) -> bool:
-        cursor = self.textCursor()
-        cursor.movePosition(
-            cursor.MoveOperation.EndOfBlock if hasattr(cursor, "MoveOperation") else cursor.EndOfBlock
-        )
-        return cursor.atEnd()
+        return self.textCursor().blockNumber() == self.document().blockCount() - 1
+
+    def _replace_all(self, text: str) -> None:
+        """Replace the whole document in one edit block.
+
+        Size-change signals from the layout are blocked during the swap and
+        a single height adjustment is queued afterwards.
+        """
+        layout = self.document().documentLayout()
+        was_blocked = layout.blockSignals(True)
+        try:
+            cursor = self.textCursor()
+            cursor.beginEditBlock()
+            cursor.select(_SELECT_DOCUMENT)
+            cursor.insertText(text)
+            cursor.endEditBlock()
+        finally:
+            layout.blockSignals(was_blocked)
+        self._adjust_height()
 
     def _move_cursor_to_end(self) -> None:
         cursor = self.textCursor()
-        cursor.movePosition(
-            cursor.MoveOperation.End if hasattr(cursor, "MoveOperation") else cursor.End
-        )
+        cursor.movePosition(_MOVE_END)
         self.setTextCursor(cursor)
 
     # --- keyboard handling ---------------------------------------------------
 
     def keyPressEvent(self, event: Any) -> None:  # noqa: N802
-        key = event.key()
-        mods = event.modifiers()
-
-        _shift = Qt.KeyboardModifier.ShiftModifier if hasattr(Qt, "KeyboardModifier") else Qt.ShiftModifier
-        _ctrl = Qt.KeyboardModifier.ControlModifier if hasattr(Qt, "KeyboardModifier") else Qt.ControlModifier
-        _no = Qt.KeyboardModifier.NoModifier if hasattr(Qt, "KeyboardModifier") else Qt.NoModifier
-
-        _Key_Return = Qt.Key.Key_Return if hasattr(Qt, "Key") else Qt.Key_Return
-        _Key_Enter = Qt.Key.Key_Enter if hasattr(Qt, "Key") else Qt.Key_Enter
-        _Key_Escape = Qt.Key.Key_Escape if hasattr(Qt, "Key") else Qt.Key_Escape
-        _Key_Up = Qt.Key.Key_Up if hasattr(Qt, "Key") else Qt.Key_Up
-        _Key_Down = Qt.Key.Key_Down if hasattr(Qt, "Key") else Qt.Key_Down
-
-        # Enter / Shift+Enter
-        if key in (_Key_Return, _Key_Enter):
-            if mods & _shift:
-                super().keyPressEvent(event)
-            else:
-                if self.submit_pressed is not None:
-                    self.submit_pressed.emit()
-            return
-
-        # Double-Esc to clear
-        if key == _Key_Escape:
-            now = time.monotonic()
-            if now - self._last_esc_time < 0.4:
-                self.clear()
-                self._last_esc_time = 0.0
-                self._history_idx = -1
-            else:
-                self._last_esc_time = now
-            return
-
-        # History Up
-        if key == _Key_Up and not (mods & _shift) and self._cursor_on_first_line():
-            if not self._history:
-                return
-            if self._history_idx == -1:
-                self._draft = self.toPlainText()
-                self._history_idx = len(self._history) - 1
-            elif self._history_idx > 0:
-                self._history_idx -= 1
-            else:
-                return
-            self.setPlainText(self._history[self._history_idx])
-            self._move_cursor_to_end()
-            return
-
-        # History Down
-        if key == _Key_Down and not (mods & _shift) and self._cursor_on_last_line():
-            if self._history_idx == -1:
-                return
-            if self._history_idx < len(self._history) - 1:
-                self._history_idx += 1
-                self.setPlainText(self._history[self._history_idx])
-            else:
-                self._history_idx = -1
-                self.setPlainText(self._draft)
-            self._move_cursor_to_end()
+        handler = self._key_handlers.get(event.key())
+        if handler is not None and handler(event, event.modifiers()):
             return
-
         super().keyPressEvent(event)
 
+    def _handle_enter(self, event: Any, mods: Any) -> bool:
+        """Enter submits; Shift+Enter falls through to insert a newline."""
+        if mods & _MOD_SHIFT:
+            return False
+        if self.submit_pressed is not None:
+            self.submit_pressed.emit()
+        return True
+
+    def _handle_escape(self, event: Any, mods: Any) -> bool:
+        """Double-Esc clears the input."""
+        now = time.monotonic()
+        if now - self._last_esc_time < 0.4:
+            self.clear()
+            self._last_esc_time = 0.0
+            self._history_idx = -1
+        else:
+            self._last_esc_time = now
+        return True
+
+    def _handle_up(self, event: Any, mods: Any) -> bool:
+        """Step back through history when the cursor is on the first line."""
+        if mods & _MOD_SHIFT or not self._cursor_on_first_line():
+            return False
+        if not self._history:
+            return True
+        if self._history_idx == -1:
+            self._draft = self.toPlainText()
+            self._history_idx = len(self._history) - 1
+        elif self._history_idx > 0:
+            self._history_idx -= 1
+        else:
+            return True
+        self._replace_all(self._history[self._history_idx])
+        self._move_cursor_to_end()
+        return True
+
+    def _handle_down(self, event: Any, mods: Any) -> bool:
+        """Step forward through history, ending back at the saved draft."""
+        if mods & _MOD_SHIFT or not self._cursor_on_last_line():
+            return False
+        if self._history_idx == -1:
+            return True
+        if self._history_idx < len(self._history) - 1:
+            self._history_idx += 1
+            self._replace_all(self._history[self._history_idx])
+        else:
+            self._history_idx = -1
+            self._replace_all(self._draft)
+        self._move_cursor_to_end()
+        return True
+
     # --- clipboard -----------------------------------------------------------
 
     def insertFromMimeData(self, source: Any) -> None:  # noqa: N802
@@ -2528,8 +3155,10 @@ class ExpandingTextEdit(QTextEdit if _QT_AVAILABLE else object):
             super().dragMoveEvent(event)
 
     def dropEvent(self, event: Any) -> None:  # noqa: N802
-        if event.mimeData().hasUrls():
-            paths = [url.toLocalFile() for url in event.mimeData().urls() if url.toLocalFile()]
+        mime = event.mimeData()
+        if mime.hasUrls():
+            # One toLocalFile() call per URL; non-local URLs map to "".
+            paths = [p for p in (url.toLocalFile() for url in mime.urls()) if p]
             if paths and self.files_dropped is not None:
                 self.files_dropped.emit(paths)
             event.acceptProposedAction()
@@ -2541,8 +3170,9 @@ class ExpandingTextEdit(QTextEdit if _QT_AVAILABLE else object):
 # Icon helpers -- custom-painted icons for buttons
 # ===================================================================
 
+@functools.lru_cache(maxsize=8)
 def _make_mic_icon(size: int = 20, color: str = "#FFFFFF") -> "QIcon":
-    """Create a microphone icon."""
+    """Create a microphone icon (cached per size/color)."""
     if not _QT_AVAILABLE:
         return None  # type: ignore[return-value]
     pixmap = QPixmap(size, size)
@@ -2584,8 +3214,12 @@ def _make_mic_icon(size: int = 20, color: str = "#FFFFFF") -> "QIcon":
     return QIcon(pixmap)
 
 
+@functools.lru_cache(maxsize=8)
 def _make_volume_icon(size: int = 20, color: str = "#FFFFFF", muted: bool = False) -> "QIcon":
-    """Create a speaker/volume icon. Pass *muted=True* for the muted variant."""
+    """Create a speaker/volume icon. Pass *muted=True* for the muted variant.
+
+    Cached per size/color/state, so toggling never re-rasterizes.
+    """
     if not _QT_AVAILABLE:
         return None  # type: ignore[return-value]
     pixmap = QPixmap(size, size)
@@ -2635,8 +3269,9 @@ def _make_volume_icon(size: int = 20, color: str = "#FFFFFF", muted: bool = Fals
     return QIcon(pixmap)
 
 
+@functools.lru_cache(maxsize=8)
 def _make_sidebar_icon(size: int = 20, color: str = "#FFFFFF", collapsed: bool = False) -> "QIcon":
-    """Create a sidebar toggle icon."""
+    """Create a sidebar toggle icon (cached per size/color/state)."""
     if not _QT_AVAILABLE:
         return None  # type: ignore[return-value]
     pixmap = QPixmap(size, size)
@@ -2671,6 +3306,12 @@ def _make_sidebar_icon(size: int = 20, color: str = "#FFFFFF", collapsed: bool =
     return QIcon(pixmap)
 
 
+@functools.lru_cache(maxsize=32)
+def _key_sequence(seq: str) -> "QKeySequence":
+    """Return a cached QKeySequence for a portable shortcut string."""
+    return QKeySequence(seq)
+
+
 # ===================================================================
 # InputBar -- text input with attachment, mic, and speaker buttons
 # ===================================================================
@@ -2685,10 +3326,14 @@ class InputBar(QWidget if _QT_AVAILABLE else object):
         attach_requested = pyqtSignal()
         files_dropped = pyqtSignal(list)
 
+    _PH_READY = "Type a message... (Enter to send, Shift+Enter for newline)"
+    _PH_THINKING = "Kait is thinking..."
+
     def __init__(self, parent: Any = None):
         if not _QT_AVAILABLE:
             return
         super().__init__(parent)
+        self._enabled_state: Optional[bool] = None
         self._speaker_on = True
 
         layout = QHBoxLayout(self)
@@ -2700,13 +3345,14 @@ class InputBar(QWidget if _QT_AVAILABLE else object):
         self._attach_btn.setObjectName("attachBtn")
         self._attach_btn.setToolTip("Attach files")
         self._attach_btn.setFixedWidth(42)
-        self._attach_btn.clicked.connect(lambda: self.attach_requested.emit())
+        self._attach_btn.clicked.connect(self.attach_requested)
         layout.addWidget(self._attach_btn)
 
         # Text input
         self._input = ExpandingTextEdit()
         self._input.setObjectName("promptInput")
-        self._input.setPlaceholderText("Type a message... (Enter to send, Shift+Enter for newline)")
+        self._input.setPlaceholderText(self._PH_READY)
+        self._placeholder = self._PH_READY
         self._input.submit_pressed.connect(self._on_submit)
         self._input.files_dropped.connect(self.files_dropped.emit)
         layout.addWidget(self._input, stretch=1)
@@ -2718,6 +3364,21 @@ class InputBar(QWidget if _QT_AVAILABLE else object):
         self._send_btn.clicked.connect(self._on_submit)
         layout.addWidget(self._send_btn)
 
+        # Mic + speaker buttons are built after the first paint; reserve
+        # their exact footprint now so the initial geometry is final.
+        self._side_slot = QWidget()
+        self._side_slot.setObjectName("inputSideButtons")
+        self._side_slot.setFixedWidth(44 * 2 + layout.spacing())
+        self._side_layout = QHBoxLayout(self._side_slot)
+        self._side_layout.setContentsMargins(0, 0, 0, 0)
+        self._side_layout.setSpacing(layout.spacing())
+        layout.addWidget(self._side_slot)
+        self._mic_btn: Optional[QPushButton] = None
+        self._speaker_btn: Optional[QPushButton] = None
+        QTimer.singleShot(0, self._build_side_buttons)
+
+    def _build_side_buttons(self) -> None:
+        """Create the mic and speaker buttons inside the reserved slot."""
         # Mic button
         self._mic_btn = QPushButton()
         self._mic_btn.setObjectName("micBtn")
@@ -2725,18 +3386,18 @@ class InputBar(QWidget if _QT_AVAILABLE else object):
         self._mic_btn.setFixedWidth(44)
         self._mic_btn.setIcon(_make_mic_icon(18))
         self._mic_btn.setIconSize(QSize(18, 18))
-        self._mic_btn.clicked.connect(lambda: self.voice_requested.emit())
-        layout.addWidget(self._mic_btn)
+        self._mic_btn.clicked.connect(self.voice_requested)
+        self._side_layout.addWidget(self._mic_btn)
 
         # Speaker button
         self._speaker_btn = QPushButton()
         self._speaker_btn.setObjectName("speakerBtn")
         self._speaker_btn.setToolTip("Toggle speaker")
         self._speaker_btn.setFixedWidth(44)
-        self._speaker_btn.setIcon(_make_volume_icon(18))
+        self._speaker_btn.setIcon(_make_volume_icon(18, muted=not self._speaker_on))
         self._speaker_btn.setIconSize(QSize(18, 18))
         self._speaker_btn.clicked.connect(self._toggle_speaker)
-        layout.addWidget(self._speaker_btn)
+        self._side_layout.addWidget(self._speaker_btn)
 
     def _on_submit(self) -> None:
         text = self._input.toPlainText().strip()
@@ -2747,25 +3408,24 @@ class InputBar(QWidget if _QT_AVAILABLE else object):
 
     def _toggle_speaker(self) -> None:
         self._speaker_on = not self._speaker_on
-        self._speaker_btn.setIcon(_make_volume_icon(18, muted=not self._speaker_on))
+        if self._speaker_btn is not None:
+            self._speaker_btn.setIcon(_make_volume_icon(18, muted=not self._speaker_on))
         self.speaker_toggled.emit(self._speaker_on)
 
     def set_enabled(self, enabled: bool) -> None:
         if not _QT_AVAILABLE:
             return
-        self._input.setEnabled(enabled)
-        self._send_btn.setEnabled(enabled)
-        self._attach_btn.setEnabled(enabled)
-        if enabled:
-            self._input.setPlaceholderText(
-                "Type a message... (Enter to send, Shift+Enter for newline)"
-            )
-        else:
-            self._input.setPlaceholderText("Kait is thinking...")
+        if enabled != self._enabled_state:
+            self._enabled_state = enabled
+            self._input.setEnabled(enabled)
+            self._send_btn.setEnabled(enabled)
+            self._attach_btn.setEnabled(enabled)
+        self.update_placeholder(self._PH_READY if enabled else self._PH_THINKING)
 
     def update_placeholder(self, text: str) -> None:
         """Update placeholder text without toggling enabled state."""
-        if _QT_AVAILABLE:
+        if _QT_AVAILABLE and text != self._placeholder:
+            self._placeholder = text
             self._input.setPlaceholderText(text)
 
     def set_focus(self) -> None:
@@ -2784,36 +3444,41 @@ class InputBar(QWidget if _QT_AVAILABLE else object):
 class FooterStatusBar(QWidget if _QT_AVAILABLE else object):
     """Footer bar showing service connection dots, mood, and evolution stage."""
 
+    _DEFAULT_SERVICES = ("Ollama", "Claude", "TTS")
+
     def __init__(self, parent: Any = None):
         if not _QT_AVAILABLE:
             return
         super().__init__(parent)
         t = Theme
-        self.setStyleSheet(
-            f"background: rgba(10, 10, 10, 0.90); "
-            f"border-top: 1px solid rgba(255, 255, 255, 0.06);"
-        )
+        # Background/border come from the global ``FooterStatusBar`` rule; a
+        # selectorless sheet here would also apply to every child label.
+        self.setAttribute(_WA_STYLED_BACKGROUND, True)
         self.setFixedHeight(32)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(14, 3, 14, 3)
         layout.setSpacing(16)
 
-        self._service_labels: Dict[str, QLabel] = {}
+        # Parallel lists indexed by service slot (also the layout position);
+        # _svc_index maps names as callers spell them to a slot.
+        self._service_labels: List[QLabel] = []
+        self._svc_state: List[Optional[bool]] = []
+        self._svc_index: Dict[str, int] = {}
 
         # Default services
-        for svc in ("Ollama", "Claude", "TTS"):
-            dot_lbl = QLabel(f"\u25CF {svc}: --")
-            dot_lbl.setStyleSheet(
-                f"color: {t.TEXT_DIM}; font-size: 11px; background: transparent; border: none;"
-            )
+        for svc in self._DEFAULT_SERVICES:
+            dot_lbl = self._make_service_label(svc)
             layout.addWidget(dot_lbl)
-            self._service_labels[svc.lower()] = dot_lbl
+            self._svc_index[svc] = self._svc_index[svc.lower()] = len(self._service_labels)
+            self._service_labels.append(dot_lbl)
+            self._svc_state.append(None)
 
         layout.addStretch()
 
         # Mood indicator
         self._mood_label = QLabel("Mood: calm")
+        self._last_mood = "calm"
         self._mood_label.setStyleSheet(
             f"color: {t.TEXT_SECONDARY}; font-size: 11px; background: transparent; border: none;"
         )
@@ -2821,45 +3486,67 @@ class FooterStatusBar(QWidget if _QT_AVAILABLE else object):
 
         # Evolution badge
         self._evo_label = QLabel("Stage 1")
+        self._last_evo = "Stage 1"
         self._evo_label.setStyleSheet(
             f"color: #FFFFFF; font-size: 11px; font-weight: 600; "
             f"background: transparent; border: none;"
         )
         layout.addWidget(self._evo_label)
 
+    @staticmethod
+    def _make_service_label(name: str) -> "QLabel":
+        """Service dot label; colour comes from the global ``state`` rules."""
+        lbl = QLabel(f"\u25CF {name}: --")
+        lbl.setObjectName("serviceDot")
+        return lbl
+
     def update_service(self, name: str, connected: bool) -> None:
         """Update a service health indicator."""
         if not _QT_AVAILABLE:
             return
-        t = Theme
-        key = name.lower()
-        if key not in self._service_labels:
-            # Dynamically add new service
-            lbl = QLabel(f"\u25CF {name}: --")
-            lbl.setStyleSheet(
-                f"color: {t.TEXT_DIM}; font-size: 11px; background: transparent; border: none;"
-            )
-            self.layout().insertWidget(len(self._service_labels), lbl)
-            self._service_labels[key] = lbl
-
-        lbl = self._service_labels[key]
-        if connected:
-            color = t.ACCENT_GREEN
-            status = "connected"
-        else:
-            color = t.ACCENT_RED
-            status = "offline"
+        idx = self._svc_index.get(name)
+        if idx is None:
+            idx = self._svc_index.get(name.lower())
+            if idx is None:
+                # Dynamically add new service
+                idx = len(self._service_labels)
+                lbl = self._make_service_label(name)
+                self.layout().insertWidget(idx, lbl)
+                self._service_labels.append(lbl)
+                self._svc_state.append(None)
+                self._svc_index[name.lower()] = idx
+            self._svc_index[name] = idx
+
+        if self._svc_state[idx] == connected:
+            return
+        self._svc_state[idx] = connected
+        lbl = self._service_labels[idx]
+        status = "connected" if connected else "offline"
         lbl.setText(f"\u25CF {name}: {status}")
-        lbl.setStyleSheet(
-            f"color: {color}; font-size: 11px; background: transparent; border: none;"
-        )
+        lbl.setProperty("state", status)
+        style = lbl.style()
+        style.unpolish(lbl)
+        style.polish(lbl)
+
+    def update_services(self, statuses: Dict[str, bool]) -> None:
+        """Update several service indicators with a single repaint."""
+        if not _QT_AVAILABLE:
+            return
+        self.setUpdatesEnabled(False)
+        try:
+            for name, connected in statuses.items():
+                self.update_service(name, connected)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def update_mood(self, mood_text: str) -> None:
-        if _QT_AVAILABLE:
+        if _QT_AVAILABLE and mood_text != self._last_mood:
+            self._last_mood = mood_text
             self._mood_label.setText(f"Mood: {mood_text}")
 
     def update_evolution(self, stage_text: str) -> None:
-        if _QT_AVAILABLE:
+        if _QT_AVAILABLE and stage_text != self._last_evo:
+            self._last_evo = stage_text
             self._evo_label.setText(stage_text)
 
 
@@ -2875,14 +3562,7 @@ class HeaderStatusBar(QWidget if _QT_AVAILABLE else object):
             return
         super().__init__(parent)
         t = Theme
-        self.setStyleSheet(
-            "background: qlineargradient(x1:0, y1:0, x2:1, y2:0, "
-            "stop:0 rgba(10, 10, 10, 0.95), "
-            "stop:0.4 rgba(18, 18, 18, 0.95), "
-            "stop:0.6 rgba(14, 14, 14, 0.95), "
-            "stop:1 rgba(10, 10, 10, 0.95)); "
-            f"border-bottom: 1px solid rgba(255, 255, 255, 0.06);"
-        )
+        # Gradient background lives in the global stylesheet (HeaderStatusBar)
         self.setFixedHeight(40)
 
         layout = QHBoxLayout(self)
@@ -2910,6 +3590,9 @@ class HeaderStatusBar(QWidget if _QT_AVAILABLE else object):
 
         # Token counter
         self._token_label = QLabel("Tokens: 0/128k")
+        self._last_used_str = ""
+        self._last_max = -1
+        self._cached_max_str = ""
         self._token_label.setStyleSheet(
             f"color: {t.TEXT_SECONDARY}; font-size: 11px; "
             f"background: transparent; border: none;"
@@ -2918,6 +3601,7 @@ class HeaderStatusBar(QWidget if _QT_AVAILABLE else object):
 
         # GPU indicator
         self._gpu_label = QLabel("GPU \u25AA")
+        self._gpu_active: Optional[bool] = None
         self._gpu_label.setStyleSheet(
             f"color: {t.TEXT_DIM}; font-size: 11px; "
             f"background: transparent; border: none;"
@@ -2939,28 +3623,36 @@ class HeaderStatusBar(QWidget if _QT_AVAILABLE else object):
     def update_tokens(self, used: int, maximum: int) -> None:
         if not _QT_AVAILABLE:
             return
-        if maximum >= 1000:
-            max_str = f"{maximum / 1000:.0f}k"
-        else:
-            max_str = str(maximum)
+        # Compare the text actually shown: above 1k it only has 0.1k resolution
         if used >= 1000:
             used_str = f"{used / 1000:.1f}k"
         else:
             used_str = str(used)
-        self._token_label.setText(f"Tokens: {used_str}/{max_str}")
+        if used_str == self._last_used_str and maximum == self._last_max:
+            return
+        self._last_used_str = used_str
+        if maximum != self._last_max:
+            self._last_max = maximum
+            if maximum >= 1000:
+                self._cached_max_str = f"{maximum / 1000:.0f}k"
+            else:
+                self._cached_max_str = str(maximum)
+        self._token_label.setText(f"Tokens: {used_str}/{self._cached_max_str}")
 
     def update_gpu(self, active: bool) -> None:
         if not _QT_AVAILABLE:
             return
+        if active == self._gpu_active:
+            return
+        self._gpu_active = active
         t = Theme
+        # Label text is constant ("GPU \u25AA"); only the colour changes
         if active:
-            self._gpu_label.setText("GPU \u25AA")
             self._gpu_label.setStyleSheet(
                 f"color: {t.ACCENT_GREEN}; font-size: 11px; "
                 f"background: transparent; border: none;"
             )
         else:
-            self._gpu_label.setText("GPU \u25AA")
             self._gpu_label.setStyleSheet(
                 f"color: {t.TEXT_DIM}; font-size: 11px; "
                 f"background: transparent; border: none;"
@@ -3003,29 +3695,34 @@ class AvatarCustomizePanel(QWidget if _QT_AVAILABLE else object):
 class OnboardingWizard(QDialog if _QT_AVAILABLE else object):
     """First-run onboarding wizard for model selection and preferences."""
 
+    _MODEL_CHOICES = (
+        "Auto-detect (recommended)",
+        "llama3.1:70b",
+        "llama3.1:8b",
+        "llama3:latest",
+        "mistral",
+    )
+
     def __init__(self, parent: Any = None):
         if not _QT_AVAILABLE:
             return
         super().__init__(parent)
         self.setWindowTitle("Welcome to Kait")
         self.setMinimumSize(480, 400)
-        self.setStyleSheet(DARK_STYLESHEET)
+        # Stylesheet and combo items are applied on first show
+        self._initialized = False
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
 
         header = QLabel("Welcome to Kait")
         header.setObjectName("headerLabel")
-        header.setAlignment(
-            Qt.AlignmentFlag.AlignCenter if hasattr(Qt, "AlignmentFlag") else Qt.AlignCenter
-        )
+        header.setAlignment(_ALIGN_CENTER)
         layout.addWidget(header)
 
         subtitle = QLabel("Your AI Open Source Sidekick.")
         subtitle.setObjectName("dimLabel")
-        subtitle.setAlignment(
-            Qt.AlignmentFlag.AlignCenter if hasattr(Qt, "AlignmentFlag") else Qt.AlignCenter
-        )
+        subtitle.setAlignment(_ALIGN_CENTER)
         layout.addWidget(subtitle)
 
         layout.addSpacing(20)
@@ -3035,13 +3732,6 @@ class OnboardingWizard(QDialog if _QT_AVAILABLE else object):
         model_lay = QVBoxLayout(model_group)
         model_lay.addWidget(QLabel("Select your preferred model:"))
         self._model_combo = QComboBox()
-        self._model_combo.addItems([
-            "Auto-detect (recommended)",
-            "llama3.1:70b",
-            "llama3.1:8b",
-            "llama3:latest",
-            "mistral",
-        ])
         model_lay.addWidget(self._model_combo)
         layout.addWidget(model_group)
 
@@ -3073,9 +3763,21 @@ class OnboardingWizard(QDialog if _QT_AVAILABLE else object):
         self.sound_enabled: bool = True
         self.avatar_enabled: bool = False
 
+    def _ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
+        self.setStyleSheet(DARK_STYLESHEET)
+        self._model_combo.addItems(list(self._MODEL_CHOICES))
+
+    def showEvent(self, event: Any) -> None:  # noqa: N802
+        self._ensure_initialized()
+        super().showEvent(event)
+
     def accept(self) -> None:
         if not _QT_AVAILABLE:
             return
+        self._ensure_initialized()
         idx = self._model_combo.currentIndex()
         if idx == 0:
             self.selected_model = "auto"
@@ -3091,7 +3793,15 @@ class OnboardingWizard(QDialog if _QT_AVAILABLE else object):
 # ===================================================================
 
 class LLMWorker(QThread if _QT_AVAILABLE else object):
-    """Runs LLM generation in a background thread."""
+    """Runs LLM generation in a background thread.
+
+    ``generate_fn`` may return the full response string, or an iterable of
+    tokens.  Tokens are forwarded through ``token_received`` in small
+    batches so a fast model does not post one queued event per token.
+    """
+
+    _TOKEN_BATCH = 8
+    _TOKEN_FLUSH_S = 0.05
 
     if _QT_AVAILABLE:
         token_received = pyqtSignal(str)
@@ -3105,6 +3815,8 @@ class LLMWorker(QThread if _QT_AVAILABLE else object):
         self._generate_fn = generate_fn
         self._user_input: str = ""
         self._context: Dict[str, Any] = {}
+        self._token_buf: List[str] = []
+        self._last_flush = 0.0
 
     def setup(self, user_input: str, context: Dict[str, Any]) -> None:
         self._user_input = user_input
@@ -3113,12 +3825,72 @@ class LLMWorker(QThread if _QT_AVAILABLE else object):
     def run(self) -> None:
         if not _QT_AVAILABLE:
             return
+        self._token_buf.clear()
+        self._last_flush = time.monotonic()
         try:
             response = self._generate_fn(self._user_input, self._context)
+            if not isinstance(response, str):
+                parts: List[str] = []
+                for token in response:
+                    parts.append(token)
+                    self._emit_token(token)
+                self._flush_tokens()
+                response = "".join(parts)
             self.generation_done.emit(response)
         except Exception as exc:
+            self._flush_tokens()
             self.generation_error.emit(str(exc))
 
+    def _emit_token(self, token: str) -> None:
+        """Buffer *token*; emit when the batch fills or 50 ms have passed."""
+        self._token_buf.append(token)
+        now = time.monotonic()
+        if (
+            len(self._token_buf) >= self._TOKEN_BATCH
+            or now - self._last_flush >= self._TOKEN_FLUSH_S
+        ):
+            self._flush_tokens(now)
+
+    def _flush_tokens(self, now: Optional[float] = None) -> None:
+        if self._token_buf:
+            self.token_received.emit("".join(self._token_buf))
+            self._token_buf.clear()
+        self._last_flush = time.monotonic() if now is None else now
+
+
+class _ArchiveSignals(QObject if _QT_AVAILABLE else object):
+    """Signals for :class:`_ArchiveRunnable` (QRunnable is not a QObject)."""
+
+    if _QT_AVAILABLE:
+        finished = pyqtSignal(dict)
+
+
+class _ArchiveRunnable(QRunnable if _QT_AVAILABLE else object):
+    """Runs one archive cycle on the global thread pool."""
+
+    def __init__(self, archive_worker: Any):
+        if not _QT_AVAILABLE:
+            return
+        super().__init__()
+        self._archive_worker = archive_worker
+        self.signals = _ArchiveSignals()
+
+    def run(self) -> None:
+        # Always emit a dict: the finished slot is what clears the
+        # window's _archive_running flag.
+        result: Any = None
+        try:
+            result = self._archive_worker.run_archive_cycle()
+        except Exception as exc:
+            result = {"batches_created": 0, "errors": [str(exc)]}
+        finally:
+            if not isinstance(result, dict):
+                result = {
+                    "batches_created": 0,
+                    "errors": [f"archive cycle returned {type(result).__name__}"],
+                }
+            self.signals.finished.emit(result)
+
 
 # Legacy no-op methods mixed into DashboardPanel for backward compat
 DashboardPanel.update_evolution = lambda self, *a, **kw: None
@@ -3153,6 +3925,19 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
     # Word count above which a response is considered "long".
     # Long responses are routed to Monitor Activity; chat shows a summary.
     _LONG_MSG_WORDS = 150
+    _METRICS_TOKEN_BUCKET = 64
+    _METRICS_FLUSH_MS = 33
+    # Minimum seconds between tab-switch driven history refreshes.
+    _HISTORY_REFRESH_MIN_S = 2.0
+
+    # (action name, key sequence, dotted slot path on the window)
+    _SHORTCUTS = (
+        ("Voice Input", "Ctrl+Shift+V", "_on_voice"),
+        ("Clear Chat", "Ctrl+L", "chat_panel.clear_chat"),
+        ("Toggle Panels", "Ctrl+B", "_toggle_side_panels"),
+        ("Quit", "Ctrl+Q", "close"),
+        ("Focus Input", "Escape", "_input_bar.set_focus"),
+    )
 
     if _QT_AVAILABLE:
         user_message_sent = pyqtSignal(str)
@@ -3186,6 +3971,9 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         # --- Header status bar ---
         self._header_bar = HeaderStatusBar()
         root_layout.addWidget(self._header_bar)
+        # Both sidebar-toggle states are rendered once and swapped on toggle
+        self._icon_collapsed = _make_sidebar_icon(18, color="#FFFFFF", collapsed=True)
+        self._icon_expanded = _make_sidebar_icon(18, color="#FFFFFF", collapsed=False)
 
         # --- Main content area (splitter) ---
         self._splitter = QSplitter(
@@ -3228,17 +4016,16 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         self._dashboard = DashboardPanel()
         self._observatory = self._dashboard  # backward compat
         self._monitor = self._dashboard      # backward compat
-        dash_scroll = QScrollArea()
-        dash_scroll.setWidget(self._dashboard)
-        dash_scroll.setWidgetResizable(True)
-        dash_scroll.setFrameStyle(QFrame.Shape.NoFrame if hasattr(QFrame, "Shape") else QFrame.NoFrame)
-        self._tab_widget.addTab(dash_scroll, "System")
+        # DashboardPanel scrolls its own content; no outer wrapper needed
+        self._tab_widget.addTab(self._dashboard, "System")
 
         # History tab
         self._history_panel = ChatHistoryPanel()
         self._tab_widget.addTab(self._history_panel, "History")
 
-        # Auto-refresh History tab when selected
+        # Auto-refresh History tab when selected.  Connected only after both
+        # addTab() calls so construction never triggers a bank refresh.
+        self._last_history_refresh_ts = 0.0
         self._tab_widget.currentChanged.connect(self._on_tab_changed)
 
         self._right_splitter.addWidget(self._tab_widget)
@@ -3289,7 +4076,8 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
             lambda _evt: self._restore_graph_section()
         )
 
-        # Detect when graph section is collapsed via splitter drag
+        # Detect when graph section is collapsed via splitter drag.  Connected
+        # after setSizes() and the reopen tab exist, so setup can't flip it.
         self._right_splitter.splitterMoved.connect(
             self._on_right_splitter_moved
         )
@@ -3314,7 +4102,16 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
 
         # Wire panel toggle button
         self._header_bar._panel_btn.clicked.connect(self._toggle_side_panels)
-        self._saved_splitter_sizes: list = []
+        self._saved_splitter_sizes: tuple = ()
+
+        # Metrics coalescing state (see update_metrics)
+        self._pending_metrics: Optional[Dict[str, Any]] = None
+        self._last_applied_metrics: Optional[Dict[str, Any]] = None
+        self._last_token_bucket: Optional[tuple] = None
+        self._metrics_timer = QTimer(self)
+        self._metrics_timer.setSingleShot(True)
+        self._metrics_timer.setInterval(self._METRICS_FLUSH_MS)
+        self._metrics_timer.timeout.connect(self._apply_pending_metrics)
 
         # --- Input bar ---
         self._input_bar = InputBar()
@@ -3333,7 +4130,7 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         self.avatar_widget = QWidget() if _QT_AVAILABLE else None
         self.avatar_customize = AvatarCustomizePanel()
         self._file_processor: Any = None
-        self._pending_attachments: List[Any] = []
+        self._pending_attachments: Deque[Any] = deque()
         self._generating: bool = False
 
         # Keyboard shortcuts
@@ -3347,14 +4144,16 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         """Hide or show the right-side panel."""
         target = getattr(self, "_right_container", self._right_splitter)
         if target.isVisible():
-            self._saved_splitter_sizes = self._splitter.sizes()
+            self._saved_splitter_sizes = tuple(self._splitter.sizes())
             target.hide()
-            self._header_bar._panel_btn.setIcon(_make_sidebar_icon(18, color="#FFFFFF", collapsed=True))
+            self._header_bar._panel_btn.setIcon(self._icon_collapsed)
         else:
             target.show()
-            if self._saved_splitter_sizes:
-                self._splitter.setSizes(self._saved_splitter_sizes)
-            self._header_bar._panel_btn.setIcon(_make_sidebar_icon(18, color="#FFFFFF", collapsed=False))
+            # Skip the re-layout when Qt already restored the same sizes
+            saved = self._saved_splitter_sizes
+            if saved and tuple(self._splitter.sizes()) != saved:
+                self._splitter.setSizes(list(saved))
+            self._header_bar._panel_btn.setIcon(self._icon_expanded)
 
     # ------------------------------------------------------------------
     # Graph section collapse / restore
@@ -3369,7 +4168,9 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
 
     def _restore_graph_section(self) -> None:
         """Restore the graph section to 50% of the right panel height."""
-        total = sum(self._right_splitter.sizes()) or 800
+        # height() avoids marshalling sizes(); minus the single handle
+        splitter = self._right_splitter
+        total = max(0, splitter.height() - splitter.handleWidth()) or 800
         half = total // 2
         self._right_splitter.setSizes([half, total - half])
         self._graph_reopen_tab.hide()
@@ -3382,30 +4183,14 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         if not _QT_AVAILABLE:
             return
 
-        voice_action = QAction("Voice Input", self)
-        voice_action.setShortcut(QKeySequence("Ctrl+Shift+V"))
-        voice_action.triggered.connect(self._on_voice)
-        self.addAction(voice_action)
-
-        clear_action = QAction("Clear Chat", self)
-        clear_action.setShortcut(QKeySequence("Ctrl+L"))
-        clear_action.triggered.connect(self.chat_panel.clear_chat)
-        self.addAction(clear_action)
-
-        panel_action = QAction("Toggle Panels", self)
-        panel_action.setShortcut(QKeySequence("Ctrl+B"))
-        panel_action.triggered.connect(self._toggle_side_panels)
-        self.addAction(panel_action)
-
-        quit_action = QAction("Quit", self)
-        quit_action.setShortcut(QKeySequence("Ctrl+Q"))
-        quit_action.triggered.connect(self.close)
-        self.addAction(quit_action)
-
-        focus_action = QAction("Focus Input", self)
-        focus_action.setShortcut(QKeySequence("Escape"))
-        focus_action.triggered.connect(lambda: self._input_bar.set_focus())
-        self.addAction(focus_action)
+        for name, seq, slot_path in self._SHORTCUTS:
+            slot: Any = self
+            for attr in slot_path.split("."):
+                slot = getattr(slot, attr)
+            action = QAction(name, self)
+            action.setShortcut(_key_sequence(seq))
+            action.triggered.connect(lambda _checked=False, fn=slot: fn())
+            self.addAction(action)
 
     # ------------------------------------------------------------------
     # Slots
@@ -3428,7 +4213,6 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         if not _QT_AVAILABLE or self._generating:
             return
         filter_str = "All files (*)"
-        from pathlib import Path
         paths, _ = QFileDialog.getOpenFileNames(
             self, "Attach Files", str(Path.home()), filter_str,
         )
@@ -3451,20 +4235,24 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         self.chat_panel.add_message(role, text, sentiment)
 
     def display_streaming_token(self, token: str) -> None:
-        """Append a streaming token to the current assistant message."""
+        """Append a streaming token to the current assistant message.
+
+        Tokens are buffered by :meth:`ChatPanel.append_token` and painted at
+        most once per 16 ms frame.
+        """
         self.chat_panel.append_token(token)
 
     def finish_streaming(self) -> str:
         """Finalise streaming. Long messages go to Monitor Activity; chat gets a summary."""
         # Peek at accumulated tokens before finalising
-        full_text = "".join(self.chat_panel._stream_tokens)
-        words = full_text.split()
+        full_text = self.chat_panel.stream_text()
+        # Approximate word count without materializing a token list
+        word_count = full_text.count(" ") + 1
 
-        if len(words) > self._LONG_MSG_WORDS:
+        if word_count > self._LONG_MSG_WORDS:
             summary = self._extract_summary(full_text)
             # Show full response in Monitor Activity tab
-            self._monitor.append_feed_entry("[Full Response]")
-            self._monitor.append_feed_entry(full_text)
+            self._monitor.append_feed_block("[Full Response]", full_text)
             # Chat bubble shows only the summary
             self.chat_panel.finish_streaming(display_text=summary)
             # Signal for TTS to speak the summary
@@ -3487,21 +4275,51 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         """Update a service health indicator in the footer."""
         self._footer_bar.update_service(service_name, is_connected)
 
+    def update_statuses(self, statuses: Dict[str, bool]) -> None:
+        """Update several footer service indicators in one batch."""
+        self._footer_bar.update_services(statuses)
+
     def update_mood(self, mood_text: str) -> None:
         """Update the mood indicator in the footer."""
         self._footer_bar.update_mood(mood_text)
 
     def update_metrics(self, metrics_dict: Dict[str, Any]) -> None:
-        """Update the processing monitor metrics."""
+        """Update the processing monitor metrics.
+
+        Calls are coalesced to one apply per ~33 ms (30 fps); only the
+        latest snapshot is applied, so fast backend polling during
+        streaming does not translate into a repaint per tick.
+        """
         if not _QT_AVAILABLE:
             return
-        self._monitor.update_metrics(metrics_dict)
+        # Repeated identical telemetry while idle: nothing to schedule
+        if self._pending_metrics is None and metrics_dict == self._last_applied_metrics:
+            return
+        self._pending_metrics = dict(metrics_dict)
+        if not self._metrics_timer.isActive():
+            self._metrics_timer.start()
+
+    def _apply_pending_metrics(self) -> None:
+        """Apply the latest metrics snapshot, touching only changed widgets."""
+        metrics_dict = self._pending_metrics
+        self._pending_metrics = None
+        if metrics_dict is None:
+            return
+        last = self._last_applied_metrics
+        if metrics_dict != last:
+            self._monitor.update_metrics(metrics_dict)
+        self._last_applied_metrics = metrics_dict
         # Also update context gauge if tokens info is present
         if "tokens_used" in metrics_dict and "tokens_max" in metrics_dict:
             used = int(metrics_dict["tokens_used"])
             maximum = int(metrics_dict["tokens_max"])
-            self._monitor.update_context_gauge(used, maximum)
+            # The header label dedupes on its displayed text itself
             self._header_bar.update_tokens(used, maximum)
+            # Bucket token counts so sub-pixel gauge deltas don't repaint
+            bucket = (used // self._METRICS_TOKEN_BUCKET, maximum)
+            if bucket != self._last_token_bucket:
+                self._last_token_bucket = bucket
+                self._monitor.update_context_gauge(used, maximum)
 
     # --- Legacy API compatibility ---
 
@@ -3525,7 +4343,9 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         self.chat_panel.add_message(ChatMessage("system", text))
 
     def add_user_message(self, text: str, attachments: Optional[List[Dict]] = None) -> None:
-        self.chat_panel.add_message(ChatMessage("user", text, attachments=attachments))
+        self.chat_panel.add_message(
+            ChatMessage("user", text, attachments=tuple(attachments or ()))
+        )
 
     def add_ai_message(self, text: str, sentiment: str = "neutral") -> None:
         self.chat_panel.add_message(ChatMessage("assistant", text, sentiment))
@@ -3558,16 +4378,31 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         theme_cls = THEMES.get(theme_name)
         if theme_cls is None:
             return
+        # Re-applying the current theme would only trigger another full
+        # polish pass over every descendant widget.
+        if theme_name == self._current_theme_name:
+            return
         self._current_theme_name = theme_name
         self._current_theme = theme_cls
-        self.setStyleSheet(build_stylesheet(theme_cls))
-        self.chat_panel.set_theme(theme_cls)
+        # Single cascaded stylesheet; ChatPanel.set_theme only records the
+        # palette, so the hierarchy is polished once with repaints paused.
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(build_stylesheet(theme_cls))
+            self.chat_panel.set_theme(theme_cls)
+        finally:
+            self.setUpdatesEnabled(True)
         self.theme_changed.emit(theme_name)
 
     def _on_tab_changed(self, index: int) -> None:
         """Auto-refresh panels when their tab is selected."""
         widget = self._tab_widget.widget(index)
         if widget is self._history_panel:
+            # Rapid tab flipping shouldn't re-query the bank every time
+            now = time.monotonic()
+            if now - self._last_history_refresh_ts < self._HISTORY_REFRESH_MIN_S:
+                return
+            self._last_history_refresh_ts = now
             self._history_panel.refresh()
 
     # --- Archive worker integration ---
@@ -3587,11 +4422,20 @@ class KaitMainWindow(QMainWindow if _QT_AVAILABLE else object):
         QTimer.singleShot(30_000, self._run_archive_check)
 
     def _run_archive_check(self) -> None:
-        """Run an archive cycle and refresh the history panel if needed."""
+        """Submit an archive cycle to the thread pool (off the UI thread)."""
         if not hasattr(self, "_archive_worker") or self._archive_worker is None:
             return
+        if getattr(self, "_archive_running", False):
+            return
+        self._archive_running = True
+        runnable = _ArchiveRunnable(self._archive_worker)
+        runnable.signals.finished.connect(self._on_archive_finished)
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_archive_finished(self, result: dict) -> None:
+        """Refresh the history panel if the archive cycle created batches."""
+        self._archive_running = False
         try:
-            result = self._archive_worker.run_archive_cycle()
             if result.get("batches_created", 0) > 0:
                 self._history_panel.refresh()
         except Exception:
@@ -26,6 +26,8 @@ Dependencies:
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import re
@@ -33,9 +35,24 @@ import html
 import time
 import math
 import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+# Optional: vectorised graph layout (falls back to pure Python)
+try:
+    import numpy as np  # type: ignore[import-untyped]
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+# Optional: JIT-compiled layout kernel on top of NumPy
+try:
+    from numba import njit, prange  # type: ignore[import-untyped]
+except ImportError:
+    njit = None
+
 # ---------------------------------------------------------------------------
 # Qt imports -- mirrors ui_module.py fallback pattern
 # ---------------------------------------------------------------------------
@@ -43,30 +60,34 @@ _QT_AVAILABLE = False
 try:
     from PyQt6.QtWidgets import (
         QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QLabel,
-        QLineEdit, QListWidget, QListWidgetItem, QTextBrowser,
+        QLineEdit, QListView, QTextBrowser,
         QFrame, QScrollArea, QSizePolicy, QPushButton, QStackedWidget,
         QTabWidget,
     )
     from PyQt6.QtCore import (
         Qt, QTimer, QFileSystemWatcher, pyqtSignal, QSize,
+        QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool,
     )
     from PyQt6.QtGui import (
         QFont, QColor, QIcon, QPixmap, QTextOption, QPainter, QPen, QBrush,
+        QTextCursor,
     )
     _QT_AVAILABLE = True
 except ImportError:
     try:
         from PyQt5.QtWidgets import (  # type: ignore[no-redef]
             QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QLabel,
-            QLineEdit, QListWidget, QListWidgetItem, QTextBrowser,
+            QLineEdit, QListView, QTextBrowser,
             QFrame, QScrollArea, QSizePolicy, QPushButton, QStackedWidget,
             QTabWidget,
         )
         from PyQt5.QtCore import (  # type: ignore[no-redef]
             Qt, QTimer, QFileSystemWatcher, pyqtSignal, QSize,
+            QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool,
         )
         from PyQt5.QtGui import (  # type: ignore[no-redef]
             QFont, QColor, QIcon, QPixmap, QTextOption, QPainter, QPen, QBrush,
+            QTextCursor,
         )
         _QT_AVAILABLE = True
     except ImportError:
@@ -92,13 +113,34 @@ _SKIP_DIRS = {".obsidian", ".git", ".trash", "__pycache__", "node_modules"}
 # Debounce interval for file watcher (ms)
 _WATCHER_DEBOUNCE_MS = 2000
 
-# Max files to display before virtualisation kicks in
-_MAX_DISPLAY_FILES = 500
+# Delay after the last keystroke before the file list is filtered (ms)
+_SEARCH_DEBOUNCE_MS = 120
+
+# vault_path -> (directory mtime signature, scanned file list, directories)
+_SCAN_CACHE: Dict[
+    str, Tuple[Tuple[Tuple[str, int], ...], List[Dict[str, Any]], List[str]]
+] = {}
+
+# On-disk cache of built vault graphs (one JSON file per vault)
+_GRAPH_CACHE_DIR = Path.home() / ".kait" / "vault_graph_cache"
 
 # Graph visualisation constants
 _GRAPH_MAX_NODES = 200
+_NOTE_CACHE_SIZE = 64  # Rendered notes kept for instant reselection
+_NOTE_CACHE_MAX_CHARS = 500_000  # Larger renders are not cached
 _GRAPH_SIM_ITERATIONS = 300
 _GRAPH_SIM_PER_TICK = 3
+_GRAPH_SIM_RELAX_ITERATIONS = 30  # When most positions come from the last session
+
+# Force-directed layout parameters
+_SIM_K_REP = 6000.0
+_SIM_K_ATT = 0.006
+_SIM_K_GRAV = 0.004
+_SIM_DAMPING = 0.88
+_SIM_MAX_FORCE = 12.0
+_SIM_MAX_SPEED = 15.0
+_SIM_BH_THETA = 0.9  # Barnes-Hut opening angle (cell size / distance)
+_SIM_BH_MIN_NODES = 80  # Below this the exact pairwise loop is cheaper
 _GRAPH_BUILD_DELAY_MS = 3000  # Delay before building graph to let GUI settle
 
 # YAML frontmatter regex
@@ -107,6 +149,12 @@ _FRONTMATTER_RE = re.compile(
     re.DOTALL,
 )
 
+# Whitespace and quote characters trimmed from frontmatter values
+_QUOTE_CHARS = " \t\r\n\f\v\"'"
+
+# Obsidian wiki-link: [[target]] or [[target|alias]] (group 1 target, 2 alias)
+_WIKILINK_RE = re.compile(r"\[\[([^\]|]+?)(?:\|([^\]]+?))?\]\]")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -131,6 +179,8 @@ def _parse_frontmatter(content: str) -> Tuple[Dict[str, str], str]:
     Returns (metadata_dict, body_text).  Metadata is a flat dict of
     key: value strings (no full YAML parsing to avoid deps).
     """
+    if not content.startswith("---"):
+        return {}, content
     match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}, content
@@ -144,7 +194,7 @@ def _parse_frontmatter(content: str) -> Tuple[Dict[str, str], str]:
         if ":" in line:
             key, _, value = line.partition(":")
             key = key.strip()
-            value = value.strip().strip('"').strip("'")
+            value = value.strip(_QUOTE_CHARS)
             if key:
                 metadata[key] = value
 
@@ -156,57 +206,259 @@ def _scan_vault(vault_path: str) -> List[Dict[str, Any]]:
 
     Each dict has: path, name, rel_path, extension, size, mtime.
     Returns empty list if vault path doesn't exist.
+
+    Results are memoised per vault and reused while no directory mtime
+    has changed (i.e. no note was added, removed or renamed).  That is
+    all the listing needs: ``size``/``mtime`` of a note edited in place
+    may lag until the next rescan (only the watched, displayed note is
+    refreshed, via :func:`_restat_scanned_file`), so code that needs
+    them fresh stats the note itself, as the graph fingerprint does.
+    The same walk also records the vault's directories for the file
+    watcher.  The returned dicts are shared with the memo and must not
+    be modified.
     """
+    return list(_scan_vault_cached(vault_path)[0])
+
+
+def _scan_vault_cached(
+    vault_path: str,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Return the memoised ``(files, dirs)`` for a vault, rescanning if stale."""
     vault = Path(vault_path)
     if not vault.is_dir():
-        return []
+        _SCAN_CACHE.pop(vault_path, None)
+        return [], []
 
-    files: List[Dict[str, Any]] = []
-    count = 0
+    cached = _SCAN_CACHE.get(vault_path)
+    if cached is not None and cached[0] == _scan_signature(cached[2]):
+        return cached[1], cached[2]
 
-    for root, dirs, filenames in os.walk(vault):
-        # Skip hidden/system directories
-        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS and not d.startswith(".")]
+    files: List[Dict[str, Any]] = []
+    dirs: List[str] = []
+    limit = 10000  # Safety cap for very large vaults
 
-        for fname in sorted(filenames):
-            ext = os.path.splitext(fname)[1].lower()
-            if ext not in _ALL_EXTENSIONS:
+    def _walk(dirpath: str, rel_dir: str) -> None:
+        # Same pre-order as os.walk, but reusing each DirEntry instead of
+        # re-joining and re-resolving every path.
+        dirs.append(dirpath)
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        matched = []
+        for entry in entries:
+            name = entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                # Skip hidden/system directories and symlinked ones
+                if name not in _SKIP_DIRS and not name.startswith("."):
+                    if not entry.is_symlink():
+                        subdirs.append(entry)
                 continue
+            ext = os.path.splitext(name)[1].lower()
+            if ext in _ALL_EXTENSIONS:
+                matched.append((name, ext, entry))
 
-            fpath = os.path.join(root, fname)
-            rel = os.path.relpath(fpath, vault_path)
-
+        matched.sort(key=lambda m: m[0])
+        for name, ext, entry in matched:
+            if len(files) >= limit:
+                break
             try:
-                stat = os.stat(fpath)
-                files.append({
-                    "path": fpath,
-                    "name": fname,
-                    "rel_path": rel,
-                    "extension": ext,
-                    "size": stat.st_size,
-                    "mtime": stat.st_mtime,
-                })
+                stat = entry.stat()
             except OSError:
                 continue
+            files.append({
+                "path": entry.path,
+                "name": name,
+                "rel_path": rel_dir + name,
+                "extension": ext,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+            })
 
-            count += 1
-            if count >= 10000:  # Safety cap for very large vaults
-                break
+        # Keep descending after the cap so the watcher still sees every dir
+        for entry in subdirs:
+            _walk(entry.path, rel_dir + entry.name + os.sep)
 
-        if count >= 10000:
-            break
+    _walk(os.fspath(vault), "")
 
     # Sort by relative path for consistent display
     files.sort(key=lambda f: f["rel_path"])
-    return files
+    _SCAN_CACHE[vault_path] = (_scan_signature(dirs), files, dirs)
+    return files, dirs
+
+
+def _restat_scanned_file(vault_path: str, file_path: str) -> Optional[Dict[str, Any]]:
+    """Re-stat one memoised note after the file watcher reported an edit.
+
+    The memo's dicts are shared with the UI and scan threads, so an updated
+    copy replaces the entry instead.  Returns that copy, or None if the note
+    is not memoised or can no longer be stat'ed (the caller should rescan).
+    """
+    cached = _SCAN_CACHE.get(vault_path)
+    if cached is None:
+        return None
+    signature, files, dirs = cached
+    for i, f in enumerate(files):
+        if f["path"] != file_path:
+            continue
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        entry = dict(f, size=stat.st_size, mtime=stat.st_mtime)
+        files = list(files)
+        files[i] = entry
+        _SCAN_CACHE[vault_path] = (signature, files, dirs)
+        return entry
+    return None
+
+
+def _scan_signature(dirs: List[str]) -> Tuple[Tuple[str, int], ...]:
+    """Return (dir, mtime_ns) for each directory that still exists."""
+    sig = []
+    for d in dirs:
+        try:
+            sig.append((d, os.stat(d).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(sig)
 
 
 def _extract_wiki_links(content: str) -> List[str]:
     """Extract [[wiki-link]] targets from Markdown content."""
-    return [
-        m.group(1).strip()
-        for m in re.finditer(r"\[\[([^\]|]+?)(?:\|[^\]]+?)?\]\]", content)
-    ]
+    if "[[" not in content:
+        return []
+    return [m.group(1).strip() for m in _WIKILINK_RE.finditer(content)]
+
+
+def _wikilink_display(match: "re.Match[str]") -> str:
+    """Substitution for ``_WIKILINK_RE``: the alias if given, else the target."""
+    return match.group(2) or match.group(1)
+
+
+def _safe_read(path: str, limit: int = 50_000) -> Optional[str]:
+    """Read up to *limit* bytes of a note for link scanning.
+
+    Returns None if unreadable, and "" when the note contains no ``[[``
+    (so the UTF-8 decode is skipped for notes without wiki-links).
+    """
+    try:
+        with open(path, "rb") as fh:
+            raw = fh.read(limit)
+    except OSError:
+        return None
+    if b"[[" not in raw:
+        return ""
+    return raw.decode("utf-8", "replace")
+
+
+def _graph_cache_file(vault_path: str) -> Path:
+    key = hashlib.sha256(os.path.abspath(vault_path).encode()).hexdigest()[:24]
+    return _GRAPH_CACHE_DIR / f"{key}.json"
+
+
+def _stat_notes(files: List[Dict[str, Any]]) -> List[Optional[os.stat_result]]:
+    """Stat every scanned note afresh (None where it can't be stat'ed).
+
+    The scan memo only notices added/removed notes, so the graph takes
+    sizes and mtimes from here rather than from the scan entries.
+    """
+    stats: List[Optional[os.stat_result]] = []
+    for f in files:
+        try:
+            stats.append(os.stat(f["path"]))
+        except OSError:
+            stats.append(None)
+    return stats
+
+
+def _graph_fingerprint(
+    files: List[Dict[str, Any]], stats: List[Optional[os.stat_result]],
+) -> str:
+    """Hash of every note's path, size and mtime (plus the node cap)."""
+    h = hashlib.sha256(str(_GRAPH_MAX_NODES).encode())
+    for f, st in zip(files, stats):
+        sig = "-" if st is None else f"{st.st_size}\0{st.st_mtime_ns}"
+        h.update(f"\n{f['rel_path']}\0{sig}".encode())
+    return h.hexdigest()
+
+
+def _load_graph_cache(
+    vault_path: str, fingerprint: str,
+) -> Optional[Tuple[List[Dict[str, Any]], List[Tuple[int, int]]]]:
+    """Return the cached ``(nodes, edges)`` if it matches *fingerprint*."""
+    try:
+        data = json.loads(_graph_cache_file(vault_path).read_text(encoding="utf-8"))
+        if data.get("fingerprint") != fingerprint:
+            return None
+        return data["nodes"], [tuple(e) for e in data["edges"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_graph_cache(
+    vault_path: str,
+    fingerprint: str,
+    nodes: List[Dict[str, Any]],
+    edges: List[Tuple[int, int]],
+) -> None:
+    try:
+        _GRAPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _graph_cache_file(vault_path)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"fingerprint": fingerprint, "nodes": nodes, "edges": edges}),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+@dataclass(slots=True)
+class _GraphNode:
+    """A vault graph node: layout state plus what the renderer needs."""
+
+    x: float
+    y: float
+    vx: float = 0.0
+    vy: float = 0.0
+    name: str = ""
+    path: str = ""
+    rel_path: str = ""
+    connections: int = 0
+    radius: float = 4.0
+    color: int = 0  # packed 0xAARRGGBB
+
+
+def _load_graph_positions(vault_path: str) -> Dict[str, Tuple[float, float]]:
+    """Return the node positions saved by the previous session, by name."""
+    path = _graph_cache_file(vault_path).with_suffix(".positions.json")
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {name: (float(x), float(y)) for name, (x, y) in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _save_graph_positions(vault_path: str, nodes: List[_GraphNode]) -> None:
+    try:
+        _GRAPH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _graph_cache_file(vault_path).with_suffix(".positions.json")
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({n.name: [n.x, n.y] for n in nodes}),
+            encoding="utf-8",
+        )
+        tmp.replace(path)
+    except OSError:
+        pass
 
 
 def _build_vault_graph(
@@ -216,12 +468,19 @@ def _build_vault_graph(
 
     Returns (nodes_list, edges_list) where each node is a dict with
     'name', 'connections', 'path', and 'rel_path' keys, and edges are
-    (idx_a, idx_b) tuples.
+    (idx_a, idx_b) tuples.  Results are cached on disk until any note's
+    size or mtime changes.
     """
     files = _scan_vault(vault_path)
     if not files:
         return [], []
 
+    stats = _stat_notes(files)
+    fingerprint = _graph_fingerprint(files, stats)
+    cached = _load_graph_cache(vault_path, fingerprint)
+    if cached is not None:
+        return cached
+
     stem_to_idx: Dict[str, int] = {}
     node_names: List[str] = []
     node_paths: List[str] = []
@@ -245,18 +504,23 @@ def _build_vault_graph(
     edges: List[Tuple[int, int]] = []
     seen_edges: set = set()
 
-    for f in files:
+    to_read: List[Tuple[str, str]] = []
+    for f, st in zip(files, stats):
         stem = os.path.splitext(f["name"])[0]
-        if stem not in stem_to_idx:
-            continue
+        if stem in stem_to_idx and st is not None and st.st_size:
+            to_read.append((stem, f["path"]))
 
-        try:
-            with open(f["path"], "r", encoding="utf-8", errors="replace") as fh:
-                content = fh.read(50_000)
-        except OSError:
+    # Reads are blocking I/O that release the GIL; overlap them, then do
+    # all parsing and shared-state updates on this thread.
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as ex:
+        contents = list(ex.map(_safe_read, (path for _, path in to_read)))
+
+    for (stem, _path), content in zip(to_read, contents):
+        if content is None:
             continue
 
-        links = _extract_wiki_links(content)
+        # A note may repeat a link many times; each target counts once
+        links = dict.fromkeys(_extract_wiki_links(content))
         src_idx = stem_to_idx[stem]
 
         for target in links:
@@ -278,9 +542,347 @@ def _build_vault_graph(
         }
         for i, name in enumerate(node_names)
     ]
+    _save_graph_cache(vault_path, fingerprint, nodes, edges)
     return nodes, edges
 
 
+def _simulate_layout(
+    nodes: List[_GraphNode], edge_list: List[Tuple[int, int]], iterations: int,
+) -> None:
+    """Advance a force-directed layout in place.
+
+    Only the ``x``, ``y``, ``vx`` and ``vy`` fields of *nodes* are used.  Uses the
+    Numba kernel when available, then NumPy, else the pure-Python loop.
+    """
+    if not nodes or iterations <= 0:
+        return
+    if _simulate_kernel is not None:
+        _simulate_layout_numba(nodes, edge_list, iterations)
+    elif np is not None:
+        _simulate_layout_numpy(nodes, edge_list, iterations)
+    else:
+        _simulate_layout_python(nodes, edge_list, iterations)
+
+
+if njit is not None and np is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _simulate_kernel(
+        x, y, vx, vy, src, tgt, iterations,
+        k_rep, k_att, k_grav, damping, max_force, max_speed,
+    ):  # pragma: no cover - compiled
+        n = x.shape[0]
+        for _ in range(iterations):
+            # Repulsion: each i sums over all j, so rows are independent
+            for i in prange(n):
+                xi = x[i]
+                yi = y[i]
+                fx = 0.0
+                fy = 0.0
+                for j in range(n):
+                    dx = x[j] - xi
+                    dy = y[j] - yi
+                    dist_sq = dx * dx + dy * dy + 1.0
+                    force = min(k_rep / dist_sq, max_force) / np.sqrt(dist_sq)
+                    fx += force * dx
+                    fy += force * dy
+                vx[i] -= fx
+                vy[i] -= fy
+
+            # Attraction along edges (scatter, kept serial)
+            for e in range(src.shape[0]):
+                s = src[e]
+                t = tgt[e]
+                dx = x[t] - x[s]
+                dy = y[t] - y[s]
+                dist = np.sqrt(dx * dx + dy * dy) + 0.01
+                scale = (k_att * dist) / dist
+                vx[s] += scale * dx
+                vy[s] += scale * dy
+                vx[t] -= scale * dx
+                vy[t] -= scale * dy
+
+            # Gravity + damping + speed cap + position update
+            for i in prange(n):
+                nvx = (vx[i] - k_grav * x[i]) * damping
+                nvy = (vy[i] - k_grav * y[i]) * damping
+                speed = np.sqrt(nvx * nvx + nvy * nvy)
+                if speed > max_speed:
+                    nvx = nvx / speed * max_speed
+                    nvy = nvy / speed * max_speed
+                vx[i] = nvx
+                vy[i] = nvy
+                x[i] += nvx
+                y[i] += nvy
+
+else:
+    _simulate_kernel = None
+
+
+def _simulate_layout_numba(
+    nodes: List[_GraphNode], edge_list: List[Tuple[int, int]], iterations: int,
+) -> None:
+    """Run the compiled layout kernel; same physics as the NumPy path."""
+    n = len(nodes)
+    state = np.array(
+        [(nd.x, nd.y, nd.vx, nd.vy) for nd in nodes], dtype=np.float64,
+    )
+    x, y, vx, vy = (np.ascontiguousarray(col) for col in state.T)
+    edges = np.array(
+        [(s, t) for s, t in edge_list if s < n and t < n], dtype=np.int64,
+    ).reshape(-1, 2)
+    _simulate_kernel(
+        x, y, vx, vy,
+        np.ascontiguousarray(edges[:, 0]), np.ascontiguousarray(edges[:, 1]),
+        iterations,
+        _SIM_K_REP, _SIM_K_ATT, _SIM_K_GRAV, _SIM_DAMPING,
+        _SIM_MAX_FORCE, _SIM_MAX_SPEED,
+    )
+    for nd, px, py, pvx, pvy in zip(
+        nodes, x.tolist(), y.tolist(), vx.tolist(), vy.tolist(),
+    ):
+        nd.x, nd.y, nd.vx, nd.vy = px, py, pvx, pvy
+
+
+def _simulate_layout_numpy(
+    nodes: List[_GraphNode], edge_list: List[Tuple[int, int]], iterations: int,
+) -> None:
+    """Vectorised layout steps; same physics as the Python path.
+
+    State is held as separate ``x``/``y``/``vx``/``vy`` arrays and the
+    pairwise terms reuse four preallocated N x N buffers, so an iteration
+    allocates nothing of size N x N.
+    """
+    n = len(nodes)
+    state = np.array(
+        [(nd.x, nd.y, nd.vx, nd.vy) for nd in nodes], dtype=np.float64,
+    )
+    x, y, vx, vy = (np.ascontiguousarray(col) for col in state.T)
+    edges = np.array(
+        [(s, t) for s, t in edge_list if s < n and t < n], dtype=np.intp,
+    ).reshape(-1, 2)
+    src, tgt = edges[:, 0], edges[:, 1]
+
+    dx = np.empty((n, n))
+    dy = np.empty((n, n))
+    w = np.empty((n, n))
+    dist = np.empty((n, n))
+
+    for _ in range(iterations):
+        # Repulsion: dx[i, j] = x[j] - x[i]; weight = min(k/d^2, max) / d
+        np.subtract(x[None, :], x[:, None], out=dx)
+        np.subtract(y[None, :], y[:, None], out=dy)
+        np.multiply(dx, dx, out=w)
+        np.multiply(dy, dy, out=dist)
+        w += dist
+        w += 1.0
+        np.sqrt(w, out=dist)
+        np.divide(_SIM_K_REP, w, out=w)
+        np.minimum(w, _SIM_MAX_FORCE, out=w)
+        w /= dist
+        dx *= w
+        dy *= w
+        vx -= dx.sum(axis=1)
+        vy -= dy.sum(axis=1)
+
+        # Attraction along edges
+        if len(edges):
+            # force k*d along the unit vector is just k * (dx, dy)
+            ex = x[tgt] - x[src]
+            ey = y[tgt] - y[src]
+            ex *= _SIM_K_ATT
+            ey *= _SIM_K_ATT
+            np.add.at(vx, src, ex)
+            np.add.at(vy, src, ey)
+            np.subtract.at(vx, tgt, ex)
+            np.subtract.at(vy, tgt, ey)
+
+        # Gravity + damping + speed cap + position update
+        vx -= _SIM_K_GRAV * x
+        vy -= _SIM_K_GRAV * y
+        vx *= _SIM_DAMPING
+        vy *= _SIM_DAMPING
+        speed = np.sqrt(vx * vx + vy * vy)
+        fast = speed > _SIM_MAX_SPEED
+        if fast.any():
+            cap = _SIM_MAX_SPEED / speed[fast]
+            vx[fast] *= cap
+            vy[fast] *= cap
+        x += vx
+        y += vy
+
+    for nd, px, py, pvx, pvy in zip(
+        nodes, x.tolist(), y.tolist(), vx.tolist(), vy.tolist(),
+    ):
+        nd.x, nd.y, nd.vx, nd.vy = px, py, pvx, pvy
+
+
+def _build_quadtree(
+    xs: List[float], ys: List[float],
+) -> Tuple[List[float], List[float], List[float], List[float], List[int], List[int]]:
+    """Build a Barnes-Hut quadtree over the given points.
+
+    Returns flat per-cell lists ``(cx, cy, mass, size, body, child)``:
+    centre of mass, point count, cell edge length, the point index for a
+    single-point leaf (-2 for a leaf of coincident points, -1 for an inner
+    cell) and four child slots per cell
+    (``child[4 * k:4 * k + 4]``, -1 when empty, all -1 for a leaf).
+    """
+    cx: List[float] = []
+    cy: List[float] = []
+    mass: List[float] = []
+    size: List[float] = []
+    body: List[int] = []
+    child: List[int] = []
+
+    x0, y0 = min(xs), min(ys)
+    span = max(max(xs) - x0, max(ys) - y0, 1.0)
+
+    def build(idx: List[int], bx: float, by: float, bsize: float, depth: int) -> int:
+        k = len(mass)
+        m = len(idx)
+        cx.append(sum(xs[i] for i in idx) / m)
+        cy.append(sum(ys[i] for i in idx) / m)
+        mass.append(float(m))
+        size.append(bsize)
+        child.extend((-1, -1, -1, -1))
+        # Coincident points would recurse forever; keep them as one leaf
+        if m == 1 or depth >= 32:
+            body.append(idx[0] if m == 1 else -2)
+            return k
+        body.append(-1)
+        half = bsize / 2.0
+        mx, my = bx + half, by + half
+        quads: List[List[int]] = [[], [], [], []]
+        for i in idx:
+            quads[(xs[i] >= mx) + 2 * (ys[i] >= my)].append(i)
+        for q, sub in enumerate(quads):
+            if sub:
+                child[4 * k + q] = build(
+                    sub, mx if q & 1 else bx, my if q & 2 else by, half, depth + 1,
+                )
+        return k
+
+    build(list(range(len(xs))), x0, y0, span, 0)
+    return cx, cy, mass, size, body, child
+
+
+def _repulsion_barnes_hut(
+    xs: List[float], ys: List[float],
+) -> List[Tuple[float, float]]:
+    """Approximate the pairwise repulsion on every point in O(N log N).
+
+    Distant cells act as a single point carrying their total mass; the
+    per-pair force law matches the exact loop in ``_simulate_layout_python``.
+    """
+    cx, cy, mass, size, body, child = _build_quadtree(xs, ys)
+    k_rep = _SIM_K_REP
+    max_force = _SIM_MAX_FORCE
+    theta_sq = _SIM_BH_THETA * _SIM_BH_THETA
+    forces: List[Tuple[float, float]] = []
+
+    for i, (xi, yi) in enumerate(zip(xs, ys)):
+        fx = fy = 0.0
+        stack = [0]
+        while stack:
+            k = stack.pop()
+            if body[k] == i:
+                continue
+            dx = cx[k] - xi
+            dy = cy[k] - yi
+            dist_sq = dx * dx + dy * dy + 1.0
+            if body[k] != -1 or size[k] * size[k] < theta_sq * dist_sq:
+                force = mass[k] * min(k_rep / dist_sq, max_force) / math.sqrt(dist_sq)
+                fx += force * dx
+                fy += force * dy
+            else:
+                stack.extend(c for c in child[4 * k:4 * k + 4] if c >= 0)
+        forces.append((fx, fy))
+    return forces
+
+
+def _simulate_layout_python(
+    nodes: List[_GraphNode], edge_list: List[Tuple[int, int]], iterations: int,
+) -> None:
+    """Pure-Python layout steps (used when NumPy is unavailable)."""
+    n = len(nodes)
+    k_rep = _SIM_K_REP
+    k_att = _SIM_K_ATT
+    k_grav = _SIM_K_GRAV
+    damping = _SIM_DAMPING
+    max_force = _SIM_MAX_FORCE
+    max_speed = _SIM_MAX_SPEED
+
+    for _ in range(iterations):
+        # Repulsive forces: quadtree approximation for larger graphs
+        if n >= _SIM_BH_MIN_NODES:
+            forces = _repulsion_barnes_hut(
+                [nd.x for nd in nodes], [nd.y for nd in nodes],
+            )
+            for node, (fx, fy) in zip(nodes, forces):
+                node.vx -= fx
+                node.vy -= fy
+        else:
+            for i in range(n):
+                ni = nodes[i]
+                for j in range(i + 1, n):
+                    nj = nodes[j]
+                    dx = nj.x - ni.x
+                    dy = nj.y - ni.y
+                    dist_sq = dx * dx + dy * dy + 1.0
+                    dist = math.sqrt(dist_sq)
+
+                    force = min(k_rep / dist_sq, max_force)
+                    fx = force * dx / dist
+                    fy = force * dy / dist
+
+                    ni.vx -= fx
+                    ni.vy -= fy
+                    nj.vx += fx
+                    nj.vy += fy
+
+        # Attractive forces along edges
+        for src, tgt in edge_list:
+            if src >= n or tgt >= n:
+                continue
+            ns = nodes[src]
+            nt = nodes[tgt]
+            dx = nt.x - ns.x
+            dy = nt.y - ns.y
+            dist = math.sqrt(dx * dx + dy * dy) + 0.01
+
+            force = k_att * dist
+            fx = force * dx / dist
+            fy = force * dy / dist
+
+            ns.vx += fx
+            ns.vy += fy
+            nt.vx -= fx
+            nt.vy -= fy
+
+        # Gravity + damping + position update
+        for node in nodes:
+            node.vx -= k_grav * node.x
+            node.vy -= k_grav * node.y
+            node.vx *= damping
+            node.vy *= damping
+
+            speed = math.sqrt(node.vx ** 2 + node.vy ** 2)
+            if speed > max_speed:
+                node.vx = node.vx / speed * max_speed
+                node.vy = node.vy / speed * max_speed
+
+            node.x += node.vx
+            node.y += node.vy
+
+
+def _canvas_node_line(node: Dict[str, Any]) -> str:
+    label = node.get("text", node.get("file", "Untitled"))
+    if isinstance(label, str):
+        label = label[:80]
+    return f"- **[{node.get('type', 'unknown')}]** {label}"
+
+
 def _render_canvas_summary(content: str) -> str:
     """Render an Obsidian .canvas file as a Markdown summary."""
     try:
@@ -291,26 +893,23 @@ def _render_canvas_summary(content: str) -> str:
     nodes = data.get("nodes", [])
     edges = data.get("edges", [])
 
-    lines = [f"# Canvas Overview\n"]
-    lines.append(f"**Nodes:** {len(nodes)} | **Connections:** {len(edges)}\n")
+    lines = [
+        "# Canvas Overview\n",
+        f"**Nodes:** {len(nodes)} | **Connections:** {len(edges)}\n",
+    ]
 
     if nodes:
         lines.append("## Nodes\n")
-        for i, node in enumerate(nodes[:50]):  # Cap at 50 nodes
-            ntype = node.get("type", "unknown")
-            label = node.get("text", node.get("file", "Untitled"))
-            if isinstance(label, str):
-                label = label[:80]
-            lines.append(f"- **[{ntype}]** {label}")
+        lines.extend(map(_canvas_node_line, nodes[:50]))  # Cap at 50 nodes
         if len(nodes) > 50:
             lines.append(f"\n*... and {len(nodes) - 50} more nodes*")
 
     if edges:
         lines.append("\n## Connections\n")
-        for i, edge in enumerate(edges[:30]):
-            from_id = edge.get("fromNode", "?")[:12]
-            to_id = edge.get("toNode", "?")[:12]
-            lines.append(f"- {from_id} → {to_id}")
+        lines.extend(
+            f"- {edge.get('fromNode', '?')[:12]} → {edge.get('toNode', '?')[:12]}"
+            for edge in edges[:30]
+        )
         if len(edges) > 30:
             lines.append(f"\n*... and {len(edges) - 30} more connections*")
 
@@ -322,40 +921,25 @@ def _build_metadata_badges(metadata: Dict[str, str]) -> str:
     if not metadata:
         return ""
 
-    badge_style = (
-        "display:inline-block; padding:2px 8px; margin:2px 4px 2px 0; "
-        "border-radius:10px; font-size:11px; "
-    )
-
     badges = []
     for key, value in metadata.items():
         if key in ("tags", "aliases"):
             # Parse comma-separated or bracket-enclosed lists
             items = value.strip("[]").split(",")
+            prefix = _BADGE_OPEN[key]
             for item in items:
-                item = item.strip().strip('"').strip("'")
+                item = item.strip(_QUOTE_CHARS)
                 if item:
-                    colour = "#30D158" if key == "tags" else "#8E8E93"
-                    badges.append(
-                        f'<span style="{badge_style}'
-                        f'background:rgba({_hex_to_rgb(colour)},0.15);'
-                        f'color:{colour};">'
-                        f'{_sanitise_html(item)}</span>'
-                    )
+                    badges.append(prefix + _sanitise_html(item) + "</span>")
         elif key == "status":
-            colour = "#30D158" if value == "active" else "#FFD60A"
+            prefix = _BADGE_OPEN["active" if value == "active" else "status"]
             badges.append(
-                f'<span style="{badge_style}'
-                f'background:rgba({_hex_to_rgb(colour)},0.15);'
-                f'color:{colour};">'
-                f'{_sanitise_html(key)}: {_sanitise_html(value)}</span>'
+                f"{prefix}{_sanitise_html(key)}: {_sanitise_html(value)}</span>"
             )
         elif key in ("created", "synced", "source"):
             badges.append(
-                f'<span style="{badge_style}'
-                f'background:rgba(142,142,147,0.12);'
-                f'color:#8E8E93;">'
-                f'{_sanitise_html(key)}: {_sanitise_html(value)}</span>'
+                f'{_BADGE_OPEN["meta"]}'
+                f"{_sanitise_html(key)}: {_sanitise_html(value)}</span>"
             )
 
     if not badges:
@@ -363,6 +947,7 @@ def _build_metadata_badges(metadata: Dict[str, str]) -> str:
     return '<div style="margin-bottom:12px;">' + "".join(badges) + "</div>"
 
 
+@functools.lru_cache(maxsize=64)
 def _hex_to_rgb(hex_color: str) -> str:
     """Convert #RRGGBB to 'R,G,B' string."""
     hex_color = hex_color.lstrip("#")
@@ -374,18 +959,32 @@ def _hex_to_rgb(hex_color: str) -> str:
     return f"{r},{g},{b}"
 
 
+_BADGE_STYLE = (
+    "display:inline-block; padding:2px 8px; margin:2px 4px 2px 0; "
+    "border-radius:10px; font-size:11px; "
+)
+
+
+def _badge_open(colour: str, background: str) -> str:
+    return f'<span style="{_BADGE_STYLE}background:{background};color:{colour};">'
+
+
+# Opening <span> per badge kind, built once
+_BADGE_OPEN = {
+    "tags": _badge_open("#30D158", f"rgba({_hex_to_rgb('#30D158')},0.15)"),
+    "aliases": _badge_open("#8E8E93", f"rgba({_hex_to_rgb('#8E8E93')},0.15)"),
+    "active": _badge_open("#30D158", f"rgba({_hex_to_rgb('#30D158')},0.15)"),
+    "status": _badge_open("#FFD60A", f"rgba({_hex_to_rgb('#FFD60A')},0.15)"),
+    "meta": _badge_open("#8E8E93", "rgba(142,142,147,0.12)"),
+}
+
+
 def _get_subdirs_to_watch(vault_path: str) -> List[str]:
-    """Get all sub-directories of a vault for the file watcher."""
-    vault = Path(vault_path)
-    if not vault.is_dir():
-        return []
+    """Get all sub-directories of a vault for the file watcher.
 
-    dirs = [str(vault)]
-    for root, subdirs, _ in os.walk(vault):
-        subdirs[:] = [d for d in subdirs if d not in _SKIP_DIRS and not d.startswith(".")]
-        for d in subdirs:
-            dirs.append(os.path.join(root, d))
-    return dirs
+    Reuses the directory list recorded by the (memoised) vault scan.
+    """
+    return list(_scan_vault_cached(vault_path)[1])
 
 
 # ===================================================================
@@ -422,13 +1021,58 @@ if _QT_AVAILABLE:
                 }
             """)
             self._current_path: str = ""
+            # path -> ((mtime_ns, size), markdown body, badges html); LRU order
+            self._render_cache: OrderedDict[str, Tuple[Tuple[int, int], str, str]] = OrderedDict()
+            # Note changed on disk while hidden; re-rendered on next show
+            self._pending_reload: Optional[Dict[str, Any]] = None
+
+        def reload_note(self, file_info: Dict[str, Any]) -> None:
+            """Re-render a changed note now, or on the next show if hidden."""
+            if self.isVisible():
+                self.show_note(file_info)
+            else:
+                self._pending_reload = file_info
+
+        def showEvent(self, event: Any) -> None:
+            super().showEvent(event)
+            if self._pending_reload is not None:
+                self.show_note(self._pending_reload)
+
+        def invalidate(self, path: str) -> None:
+            """Drop the cached render of *path* (e.g. after it changed)."""
+            self._render_cache.pop(path, None)
+
+        def _cache_render(
+            self, fpath: str, sig: Optional[Tuple[int, int]], body: str, badges_html: str,
+        ) -> None:
+            if sig is None or len(body) + len(badges_html) > _NOTE_CACHE_MAX_CHARS:
+                return
+            self._render_cache[fpath] = (sig, body, badges_html)
+            self._render_cache.move_to_end(fpath)
+            while len(self._render_cache) > _NOTE_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
 
         def show_note(self, file_info: Dict[str, Any]) -> None:
             """Load and render a vault note."""
+            self._pending_reload = None
             fpath = file_info.get("path", "")
             ext = file_info.get("extension", "")
             self._current_path = fpath
 
+            # Reselecting an unchanged note reuses the previous render
+            sig: Optional[Tuple[int, int]] = None
+            if ext != ".canvas":
+                try:
+                    st = os.stat(fpath)
+                    sig = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    pass
+                cached = self._render_cache.get(fpath)
+                if cached is not None and sig is not None and cached[0] == sig:
+                    self._render_cache.move_to_end(fpath)
+                    self._render_body(cached[1], cached[2])
+                    return
+
             try:
                 with open(fpath, "r", encoding="utf-8", errors="replace") as f:
                     content = f.read()
@@ -451,29 +1095,32 @@ if _QT_AVAILABLE:
             badges_html = _build_metadata_badges(metadata)
 
             # Convert Obsidian wiki-links [[target]] → readable text
-            body = re.sub(
-                r"\[\[([^\]|]+?)(?:\|([^\]]+?))?\]\]",
-                lambda m: m.group(2) if m.group(2) else m.group(1),
-                body,
-            )
+            if "[[" in body:
+                body = _WIKILINK_RE.sub(_wikilink_display, body)
 
-            # Use setMarkdown for the body, but prepend badges as HTML
-            if badges_html:
-                # Render markdown to get the body HTML, then combine
-                self.setMarkdown(body)
-                body_html = self.toHtml()
-                # Insert badges after <body> tag
-                body_html = body_html.replace(
-                    "<body",
-                    f"<body><div>{badges_html}</div><hr style='border:1px solid #2C2C2E;margin:8px 0;'/><div",
-                    1,
-                )
-                # Close the extra div
-                if "</body>" in body_html:
-                    body_html = body_html.replace("</body>", "</div></body>", 1)
-                self.setHtml(body_html)
-            else:
-                self.setMarkdown(body)
+            self._render_body(body, badges_html)
+            self._cache_render(fpath, sig, body, badges_html)
+
+        def _render_body(self, body: str, badges_html: str) -> None:
+            """Render the Markdown *body* with the badges block above it.
+
+            Badges are inserted into the document built by setMarkdown(),
+            so the note is laid out once instead of going through a
+            toHtml()/setHtml() round trip.
+            """
+            self.setMarkdown(body)
+            if not badges_html:
+                return
+            cursor = QTextCursor(self.document())
+            cursor.beginEditBlock()
+            # Fresh leading block so the first Markdown block keeps its format
+            cursor.insertBlock()
+            cursor.setPosition(0)
+            cursor.insertHtml(
+                f"<div>{badges_html}</div>"
+                f"<hr style='border:1px solid #2C2C2E;margin:8px 0;'/>"
+            )
+            cursor.endEditBlock()
 
         def show_placeholder(self, message: str = "Select a note to view") -> None:
             """Show a placeholder message."""
@@ -507,6 +1154,49 @@ if _QT_AVAILABLE:
                 '</div>'
             )
 
+    # ===================================================================
+    # VaultFileModel -- lazy list model over scanned file dicts
+    # ===================================================================
+
+    class VaultFileModel(QAbstractListModel):
+        """Read-only model over ``_scan_vault`` dicts.
+
+        Row text is built on demand, so only rows the view actually
+        paints cost anything.
+        """
+
+        def __init__(self, parent: Optional[Any] = None):
+            super().__init__(parent)
+            self._files: List[Dict[str, Any]] = []
+
+        def set_files(self, files: List[Dict[str, Any]]) -> None:
+            self.beginResetModel()
+            self._files = files
+            self.endResetModel()
+
+        def file_at(self, row: int) -> Optional[Dict[str, Any]]:
+            if 0 <= row < len(self._files):
+                return self._files[row]
+            return None
+
+        def rowCount(self, parent: Any = QModelIndex()) -> int:  # noqa: N802
+            return 0 if parent.isValid() else len(self._files)
+
+        def data(self, index: Any, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+            if not index.isValid():
+                return None
+            f = self._files[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                icon = "📝" if f["extension"] == ".md" else "🎨"
+                # Show folder path as subtle prefix
+                folder = os.path.dirname(f["rel_path"])
+                if folder:
+                    return f"{icon}  {folder}/{f['name']}"
+                return f"{icon}  {f['name']}"
+            if role == Qt.ItemDataRole.UserRole:
+                return f
+            return None
+
     # ===================================================================
     # VaultFileList -- searchable file list with categories
     # ===================================================================
@@ -520,6 +1210,13 @@ if _QT_AVAILABLE:
             super().__init__(parent)
             self._files: List[Dict[str, Any]] = []
             self._filtered: List[Dict[str, Any]] = []
+            self._search_keys: List[Tuple[str, str]] = []
+
+            # Coalesce keystrokes into one filter pass
+            self._search_timer = QTimer(self)
+            self._search_timer.setSingleShot(True)
+            self._search_timer.setInterval(_SEARCH_DEBOUNCE_MS)
+            self._search_timer.timeout.connect(self._apply_filter)
 
             layout = QVBoxLayout(self)
             layout.setContentsMargins(0, 0, 0, 0)
@@ -553,102 +1250,110 @@ if _QT_AVAILABLE:
             )
             layout.addWidget(self._count_label)
 
-            # File list
-            self._list = QListWidget()
+            # File list (virtualised: rows are realised only when painted)
+            self._model = VaultFileModel(self)
+            self._list = QListView()
+            self._list.setModel(self._model)
+            self._list.setUniformItemSizes(True)
             self._list.setStyleSheet("""
-                QListWidget {
+                QListView {
                     background: transparent;
                     border: none;
                     outline: none;
                     font-size: 12px;
                 }
-                QListWidget::item {
+                QListView::item {
                     color: #C7C7CC;
                     padding: 6px 12px;
                     border: none;
                     border-bottom: 1px solid rgba(255,255,255,0.03);
                 }
-                QListWidget::item:selected {
+                QListView::item:selected {
                     background: rgba(255,255,255,0.06);
                     color: #FFFFFF;
                 }
-                QListWidget::item:hover:!selected {
+                QListView::item:hover:!selected {
                     background: rgba(255,255,255,0.03);
                 }
             """)
-            self._list.currentRowChanged.connect(self._on_item_selected)
+            self._list.selectionModel().currentRowChanged.connect(
+                self._on_item_selected
+            )
             layout.addWidget(self._list, stretch=1)
 
         def set_files(self, files: List[Dict[str, Any]]) -> None:
             """Set the full file list and refresh display."""
             self._files = files
+            # Lowercased once here so filtering is plain substring tests
+            self._search_keys = [
+                (f["name"].lower(), f["rel_path"].lower()) for f in files
+            ]
             self._apply_filter()
 
-        def refresh_file(self, file_path: str) -> None:
-            """Update a single file entry if it exists in the list."""
-            for i, f in enumerate(self._files):
-                if f["path"] == file_path:
-                    try:
-                        stat = os.stat(file_path)
-                        f["size"] = stat.st_size
-                        f["mtime"] = stat.st_mtime
-                    except OSError:
-                        pass
-                    break
+        def replace_file(self, entry: Dict[str, Any]) -> None:
+            """Swap in an updated entry for the listed file at the same path."""
+            for files in (self._files, self._filtered):
+                for i, f in enumerate(files):
+                    if f["path"] == entry["path"]:
+                        files[i] = entry
+                        break
 
         def _apply_filter(self) -> None:
             """Apply current search filter and refresh the list widget."""
+            self._search_timer.stop()
             query = self._search.text().strip().lower()
             if query:
                 self._filtered = [
-                    f for f in self._files
-                    if query in f["name"].lower() or query in f["rel_path"].lower()
+                    f for f, (name, rel) in zip(self._files, self._search_keys)
+                    if query in name or query in rel
                 ]
             else:
                 self._filtered = list(self._files)
 
-            # Cap display for performance
-            display = self._filtered[:_MAX_DISPLAY_FILES]
+            selection = self._list.selectionModel()
+            selection.blockSignals(True)
+            self._model.set_files(self._filtered)
+            selection.blockSignals(False)
 
-            self._list.blockSignals(True)
-            self._list.clear()
-
-            for f in display:
-                icon = "📝" if f["extension"] == ".md" else "🎨"
-                # Show folder path as subtle prefix
-                folder = os.path.dirname(f["rel_path"])
-                if folder:
-                    text = f"{icon}  {folder}/{f['name']}"
-                else:
-                    text = f"{icon}  {f['name']}"
-                item = QListWidgetItem(text)
-                item.setData(Qt.ItemDataRole.UserRole, f)
-                self._list.addItem(item)
-
-            self._list.blockSignals(False)
-
-            total = len(self._filtered)
-            shown = len(display)
-            if total > shown:
-                self._count_label.setText(
-                    f"{shown} of {total} notes (filter to see more)"
-                )
-            else:
-                self._count_label.setText(f"{total} notes")
+            self._count_label.setText(f"{len(self._filtered)} notes")
 
         def _on_search(self, _text: str) -> None:
-            self._apply_filter()
+            self._search_timer.start()
 
-        def _on_item_selected(self, row: int) -> None:
-            if row < 0:
-                return
-            item = self._list.item(row)
-            if item is None:
-                return
-            file_info = item.data(Qt.ItemDataRole.UserRole)
+        def _on_item_selected(self, current: Any, _previous: Any = None) -> None:
+            file_info = self._model.file_at(current.row())
             if file_info:
                 self.file_selected.emit(file_info)
 
+    # ===================================================================
+    # Background vault scan
+    # ===================================================================
+
+    class _VaultScanSignals(QObject):
+        """Signals for :class:`_VaultScanRunnable`."""
+
+        # (files, watch directories)
+        finished = pyqtSignal(object)
+
+    class _VaultScanRunnable(QRunnable):
+        """Scans a vault on the global thread pool."""
+
+        def __init__(self, vault_path: str):
+            super().__init__()
+            self._vault_path = vault_path
+            self.signals = _VaultScanSignals()
+
+        def run(self) -> None:
+            # Always emit, so the panel's _scan_running flag is cleared
+            result: Tuple[List[Dict[str, Any]], List[str]] = ([], [])
+            try:
+                files, dirs = _scan_vault_cached(self._vault_path)
+                result = (list(files), list(dirs))
+            except Exception:
+                pass
+            finally:
+                self.signals.finished.emit(result)
+
     # ===================================================================
     # VaultViewerPanel -- main vault tab widget
     # ===================================================================
@@ -680,8 +1385,16 @@ if _QT_AVAILABLE:
             self._files: List[Dict[str, Any]] = []
             self._watcher: Optional[QFileSystemWatcher] = None
             self._debounce_timer: Optional[QTimer] = None
+            # Paths reported by fileChanged since the last debounced refresh
+            self._changed_paths: set = set()
+            # A directory changed (file added/removed) -- needs a full rescan
+            self._dirs_changed: bool = False
             self._last_scan_time: float = 0.0
             self._is_online: bool = False
+            # Only one background scan at a time; refreshes requested while
+            # it runs are folded into a single follow-up scan
+            self._scan_running: bool = False
+            self._rescan_pending: bool = False
 
             self._setup_ui()
             self._setup_watcher()
@@ -778,7 +1491,7 @@ if _QT_AVAILABLE:
             self.refresh()
 
         def refresh(self) -> None:
-            """Re-scan the vault and update the file list."""
+            """Re-scan the vault (on the thread pool) and update the file list."""
             vault = Path(self._vault_path)
 
             if not vault.is_dir():
@@ -791,7 +1504,25 @@ if _QT_AVAILABLE:
                 )
                 return
 
-            self._files = _scan_vault(self._vault_path)
+            if self._scan_running:
+                self._rescan_pending = True
+                return
+            self._scan_running = True
+            runnable = _VaultScanRunnable(self._vault_path)
+            runnable.signals.finished.connect(self._on_scan_finished)
+            QThreadPool.globalInstance().start(runnable)
+
+        def _on_scan_finished(self, result: Tuple[List[Dict[str, Any]], List[str]]) -> None:
+            """Apply a finished background scan."""
+            self._scan_running = False
+            if self._rescan_pending:
+                # Something changed while scanning; this result may be stale
+                self._rescan_pending = False
+                _SCAN_CACHE.pop(self._vault_path, None)
+                self.refresh()
+                return
+
+            self._files, dirs = result
             self._is_online = True
             self._last_scan_time = time.time()
 
@@ -813,9 +1544,9 @@ if _QT_AVAILABLE:
                     self._watcher.removePaths(old_files)
 
                 # Add new paths
-                dirs = _get_subdirs_to_watch(self._vault_path)
                 if dirs:
                     self._watcher.addPaths(dirs)
+                self._watch_current_note()
 
             # If no note selected, show placeholder
             if not self._note_viewer._current_path:
@@ -826,33 +1557,68 @@ if _QT_AVAILABLE:
             # Emit update signal for Kait hooks
             self.vault_updated.emit(self._vault_path)
 
+        def _watch_current_note(self) -> None:
+            """Watch the displayed note's file so in-place edits re-render it."""
+            if self._watcher is None:
+                return
+            current = self._note_viewer._current_path
+            watched = self._watcher.files()
+            stale = [p for p in watched if p != current]
+            if stale:
+                self._watcher.removePaths(stale)
+            if current and current not in watched and os.path.isfile(current):
+                self._watcher.addPath(current)
+
         def _on_directory_changed(self, _path: str) -> None:
             """Handle directory change (file added/removed)."""
+            self._dirs_changed = True
             if self._debounce_timer is not None:
                 self._debounce_timer.start()
 
         def _on_file_changed(self, path: str) -> None:
-            """Handle individual file change."""
-            # Refresh the file in the list
-            self._file_list.refresh_file(path)
-
-            # If this file is currently displayed, re-render it
-            if path == self._note_viewer._current_path:
-                for f in self._files:
-                    if f["path"] == path:
-                        self._note_viewer.show_note(f)
-                        break
-
+            """Handle individual file change (handled with the next refresh)."""
+            self._changed_paths.add(path)
             if self._debounce_timer is not None:
                 self._debounce_timer.start()
 
         def _debounced_refresh(self) -> None:
-            """Debounced refresh after file system changes."""
-            self.refresh()
+            """Debounced refresh after a burst of file system changes.
+
+            Pure content edits only re-stat the edited files; the vault is
+            rescanned only when a directory changed or a file went missing.
+            """
+            changed = self._changed_paths
+            self._changed_paths = set()
+            rescan = self._dirs_changed
+            self._dirs_changed = False
+            for path in changed:
+                self._note_viewer.invalidate(path)
+                if rescan:
+                    continue
+                entry = _restat_scanned_file(self._vault_path, path)
+                if entry is None:
+                    rescan = True
+                else:
+                    self._file_list.replace_file(entry)
+            if rescan:
+                _SCAN_CACHE.pop(self._vault_path, None)
+                self.refresh()
+            else:
+                # Editors that replace the file drop it from the watcher
+                self._watch_current_note()
+
+            # If the displayed note changed, re-render it once
+            current = self._note_viewer._current_path
+            if current and current in changed:
+                for f in self._files:
+                    if f["path"] == current:
+                        self._note_viewer.reload_note(f)
+                        break
 
         def _on_file_selected(self, file_info: Dict[str, Any]) -> None:
             """Handle file selection from the list."""
             self._note_viewer.show_note(file_info)
+            self._watch_current_note()
 
         @property
         def vault_path(self) -> str:
@@ -910,6 +1676,43 @@ if _QT_AVAILABLE:
     # VaultGraphWidget -- force-directed graph with labels & interaction
     # ===================================================================
 
+    class _GraphSimSignals(QObject):
+        """Signals for :class:`_GraphSimRunnable` (QRunnable is not a QObject)."""
+
+        # (generation, [(x, y, vx, vy), ...])
+        finished = pyqtSignal(object)
+
+    class _GraphSimRunnable(QRunnable):
+        """Runs the graph layout on the global thread pool.
+
+        Works on its own copy of the node coordinates so the widget can keep
+        painting while the layout settles.
+        """
+
+        def __init__(
+            self,
+            coords: List[Tuple[float, float, float, float]],
+            edges: List[Tuple[int, int]],
+            iterations: int,
+            generation: int,
+        ):
+            super().__init__()
+            self._coords = coords
+            self._edges = edges
+            self._iterations = iterations
+            self._generation = generation
+            self.signals = _GraphSimSignals()
+
+        def run(self) -> None:
+            nodes = [
+                _GraphNode(x, y, vx, vy) for x, y, vx, vy in self._coords
+            ]
+            _simulate_layout(nodes, self._edges, self._iterations)
+            self.signals.finished.emit((
+                self._generation,
+                [(n.x, n.y, n.vx, n.vy) for n in nodes],
+            ))
+
     class VaultGraphWidget(QWidget):
         """Interactive force-directed graph of Obsidian vault connections.
 
@@ -936,7 +1739,7 @@ if _QT_AVAILABLE:
             super().__init__(parent)
             self._vault_path = vault_path
             self._title = title
-            self._nodes: List[Dict[str, Any]] = []
+            self._nodes: List[_GraphNode] = []
             self._edges: List[Tuple[int, int]] = []
             self._is_online: bool = False
 
@@ -954,6 +1757,18 @@ if _QT_AVAILABLE:
 
             # Simulation state
             self._sim_step: int = 0
+            # Background layout in flight; results from older runs are ignored
+            self._layout_pending: bool = False
+            self._sim_generation: int = 0
+            # Bumped whenever node positions change
+            self._layout_version: int = 0
+
+            # Projected node centres, reused until positions or view change
+            self._screen_key: Optional[Tuple[Any, ...]] = None
+            self._screen_xy: List[Tuple[float, float]] = []
+
+            # (argb, alpha, lighter %) -> brush; nodes share few colours
+            self._brush_cache: Dict[Tuple[int, int, int], QBrush] = {}
 
             # Pixmap cache to avoid expensive repaints during resize
             self._cached_pixmap: Optional["QPixmap"] = None
@@ -979,9 +1794,9 @@ if _QT_AVAILABLE:
             self._sim_timer.setInterval(16)
             self._sim_timer.timeout.connect(self._step_simulation)
 
-            # Eager build -- scan vault synchronously so graph is ready
-            # before the GUI window is shown (avoids "Vault not found" flash).
-            # Only the force-simulation animation is deferred.
+            # Eager build -- scan vault synchronously so the graph data is
+            # ready before the GUI window is shown (avoids "Vault not found"
+            # flash).  The force layout runs on the thread pool.
             self._build_graph(defer_sim=True)
 
         # -- Resize debounce / cache management --------------------------
@@ -1013,10 +1828,9 @@ if _QT_AVAILABLE:
             """Scan vault and build the graph.
 
             Args:
-                defer_sim: When True, delay starting the force-simulation
-                    timer so it runs after the GUI event loop is active.
-                    Used during __init__ to load vault data eagerly while
-                    keeping the animation smooth.
+                defer_sim: When True, lay the graph out in one pass on the
+                    global thread pool and show it once settled, instead
+                    of animating it with the simulation timer.
             """
             vault = Path(self._vault_path)
             if not vault.is_dir():
@@ -1036,7 +1850,10 @@ if _QT_AVAILABLE:
             # Find max connections for normalisation
             max_conns = max((n["connections"] for n in raw_nodes), default=1) or 1
 
-            # Initialise node positions randomly (deterministic seed)
+            # Initialise node positions from the last session where known,
+            # else randomly (deterministic seed)
+            saved = _load_graph_positions(self._vault_path)
+            seeded = 0
             rng = random.Random(42)
             for n in raw_nodes:
                 conns = n["connections"]
@@ -1053,47 +1870,78 @@ if _QT_AVAILABLE:
                     r = int(120 + (40 - 120) * t2)
                     g = int(120 + (180 - 120) * t2)
                     b = int(130 + (120 - 130) * t2)
-                color = QColor(r, g, b)
+                # Packed 0xAARRGGBB; brushes are built per distinct colour
+                color = 0xFF000000 | (r << 16) | (g << 8) | b
 
                 # Radius scales with connections: 4..18
                 radius = 4.0 + min(conns, 12) * 1.2
 
-                self._nodes.append({
-                    "name": n["name"],
-                    "connections": conns,
-                    "path": n.get("path", ""),
-                    "rel_path": n.get("rel_path", ""),
-                    "x": rng.uniform(-300, 300),
-                    "y": rng.uniform(-300, 300),
-                    "vx": 0.0,
-                    "vy": 0.0,
-                    "radius": radius,
-                    "color": color,
-                })
-
-            # Run force simulation
+                x, y = rng.uniform(-300, 300), rng.uniform(-300, 300)
+                if n["name"] in saved:
+                    x, y = saved[n["name"]]
+                    seeded += 1
+
+                self._nodes.append(_GraphNode(
+                    x,
+                    y,
+                    name=n["name"],
+                    path=n.get("path", ""),
+                    rel_path=n.get("rel_path", ""),
+                    connections=conns,
+                    radius=radius,
+                    color=color,
+                ))
+
+            self._layout_version += 1
+
+            # Run force simulation; a mostly known layout only needs to relax
             self._sim_step = 0
+            if seeded * 2 >= len(self._nodes):
+                self._sim_step = _GRAPH_SIM_ITERATIONS - _GRAPH_SIM_RELAX_ITERATIONS
             if defer_sim:
-                # Run the full simulation synchronously so the graph is
-                # completely laid out before the window is shown.
-                self._run_simulation_sync()
-                self._fit_to_view()
-                self._invalidate_cache()
-                # Re-fit once the widget gets its real size from layout.
-                self._needs_initial_fit = True
+                self._start_background_layout()
             else:
                 self._sim_timer.start()
 
+        def _start_background_layout(self) -> None:
+            """Run the full layout off the UI thread."""
+            self._sim_generation += 1
+            self._layout_pending = True
+            runnable = _GraphSimRunnable(
+                [(n.x, n.y, n.vx, n.vy) for n in self._nodes],
+                list(self._edges),
+                _GRAPH_SIM_ITERATIONS - self._sim_step,
+                self._sim_generation,
+            )
+            runnable.signals.finished.connect(self._on_layout_ready)
+            QThreadPool.globalInstance().start(runnable)
+
+        def _on_layout_ready(self, result: Tuple[int, List[Tuple[float, ...]]]) -> None:
+            generation, coords = result
+            if generation != self._sim_generation:
+                return
+            for node, (x, y, vx, vy) in zip(self._nodes, coords):
+                node.x, node.y, node.vx, node.vy = x, y, vx, vy
+            self._layout_version += 1
+            self._sim_step = _GRAPH_SIM_ITERATIONS
+            self._layout_pending = False
+            _save_graph_positions(self._vault_path, self._nodes)
+            self._fit_to_view()
+            # Re-fit once the widget gets its real size from layout.
+            self._needs_initial_fit = not self.isVisible()
+            self._invalidate_cache()
+            self.update()
+
         # -- Physics simulation ------------------------------------------
 
         def _fit_to_view(self) -> None:
             """Zoom and pan so the entire graph fits the viewport."""
             if not self._nodes:
                 return
-            min_x = min(n["x"] for n in self._nodes)
-            max_x = max(n["x"] for n in self._nodes)
-            min_y = min(n["y"] for n in self._nodes)
-            max_y = max(n["y"] for n in self._nodes)
+            min_x = min(n.x for n in self._nodes)
+            max_x = max(n.x for n in self._nodes)
+            min_y = min(n.y for n in self._nodes)
+            max_y = max(n.y for n in self._nodes)
 
             graph_w = (max_x - min_x) + 80  # padding for node radius + labels
             graph_h = (max_y - min_y) + 80
@@ -1115,154 +1963,27 @@ if _QT_AVAILABLE:
             self._offset_x = -cx * self._zoom
             self._offset_y = -cy * self._zoom
 
-        def _run_simulation_sync(self) -> None:
-            """Run the full force-directed simulation synchronously.
-
-            This is pure math with no Qt event-loop dependency, so it is
-            safe to call during __init__ before the window is shown.
-            Completes all ``_GRAPH_SIM_ITERATIONS`` in one shot so the
-            graph layout is fully settled before the first paint.
-            """
-            n = len(self._nodes)
-            if not n:
+        def _simulate(self, iterations: int) -> None:
+            """Advance the layout by up to *iterations* steps."""
+            iterations = min(iterations, _GRAPH_SIM_ITERATIONS - self._sim_step)
+            if not self._nodes or iterations <= 0:
                 return
-
-            k_rep = 6000.0
-            k_att = 0.006
-            k_grav = 0.004
-            damping = 0.88
-            max_force = 12.0
-
-            while self._sim_step < _GRAPH_SIM_ITERATIONS:
-                # Repulsive forces between all node pairs
-                for i in range(n):
-                    ni = self._nodes[i]
-                    for j in range(i + 1, n):
-                        nj = self._nodes[j]
-                        dx = nj["x"] - ni["x"]
-                        dy = nj["y"] - ni["y"]
-                        dist_sq = dx * dx + dy * dy + 1.0
-                        dist = math.sqrt(dist_sq)
-
-                        force = min(k_rep / dist_sq, max_force)
-                        fx = force * dx / dist
-                        fy = force * dy / dist
-
-                        ni["vx"] -= fx
-                        ni["vy"] -= fy
-                        nj["vx"] += fx
-                        nj["vy"] += fy
-
-                # Attractive forces along edges
-                for src, tgt in self._edges:
-                    if src >= n or tgt >= n:
-                        continue
-                    ns = self._nodes[src]
-                    nt = self._nodes[tgt]
-                    dx = nt["x"] - ns["x"]
-                    dy = nt["y"] - ns["y"]
-                    dist = math.sqrt(dx * dx + dy * dy) + 0.01
-
-                    force = k_att * dist
-                    fx = force * dx / dist
-                    fy = force * dy / dist
-
-                    ns["vx"] += fx
-                    ns["vy"] += fy
-                    nt["vx"] -= fx
-                    nt["vy"] -= fy
-
-                # Gravity + damping + position update
-                for node in self._nodes:
-                    node["vx"] -= k_grav * node["x"]
-                    node["vy"] -= k_grav * node["y"]
-                    node["vx"] *= damping
-                    node["vy"] *= damping
-
-                    speed = math.sqrt(node["vx"] ** 2 + node["vy"] ** 2)
-                    if speed > 15.0:
-                        node["vx"] = node["vx"] / speed * 15.0
-                        node["vy"] = node["vy"] / speed * 15.0
-
-                    node["x"] += node["vx"]
-                    node["y"] += node["vy"]
-
-                self._sim_step += 1
+            _simulate_layout(self._nodes, self._edges, iterations)
+            self._layout_version += 1
+            self._sim_step += iterations
 
         def _step_simulation(self) -> None:
             """Run a few iterations of the force-directed layout."""
             if not self._nodes or self._sim_step >= _GRAPH_SIM_ITERATIONS:
                 self._sim_timer.stop()
+                if self._nodes:
+                    _save_graph_positions(self._vault_path, self._nodes)
                 self._fit_to_view()
                 self._invalidate_cache()
                 self.update()
                 return
 
-            n = len(self._nodes)
-            k_rep = 6000.0
-            k_att = 0.006
-            k_grav = 0.004
-            damping = 0.88
-            max_force = 12.0
-
-            for _ in range(_GRAPH_SIM_PER_TICK):
-                if self._sim_step >= _GRAPH_SIM_ITERATIONS:
-                    break
-
-                # Repulsive forces between all node pairs
-                for i in range(n):
-                    ni = self._nodes[i]
-                    for j in range(i + 1, n):
-                        nj = self._nodes[j]
-                        dx = nj["x"] - ni["x"]
-                        dy = nj["y"] - ni["y"]
-                        dist_sq = dx * dx + dy * dy + 1.0
-                        dist = math.sqrt(dist_sq)
-
-                        force = min(k_rep / dist_sq, max_force)
-                        fx = force * dx / dist
-                        fy = force * dy / dist
-
-                        ni["vx"] -= fx
-                        ni["vy"] -= fy
-                        nj["vx"] += fx
-                        nj["vy"] += fy
-
-                # Attractive forces along edges
-                for src, tgt in self._edges:
-                    if src >= n or tgt >= n:
-                        continue
-                    ns = self._nodes[src]
-                    nt = self._nodes[tgt]
-                    dx = nt["x"] - ns["x"]
-                    dy = nt["y"] - ns["y"]
-                    dist = math.sqrt(dx * dx + dy * dy) + 0.01
-
-                    force = k_att * dist
-                    fx = force * dx / dist
-                    fy = force * dy / dist
-
-                    ns["vx"] += fx
-                    ns["vy"] += fy
-                    nt["vx"] -= fx
-                    nt["vy"] -= fy
-
-                # Gravity + damping + position update
-                for node in self._nodes:
-                    node["vx"] -= k_grav * node["x"]
-                    node["vy"] -= k_grav * node["y"]
-                    node["vx"] *= damping
-                    node["vy"] *= damping
-
-                    speed = math.sqrt(node["vx"] ** 2 + node["vy"] ** 2)
-                    if speed > 15.0:
-                        node["vx"] = node["vx"] / speed * 15.0
-                        node["vy"] = node["vy"] / speed * 15.0
-
-                    node["x"] += node["vx"]
-                    node["y"] += node["vy"]
-
-                self._sim_step += 1
+            self._simulate(_GRAPH_SIM_PER_TICK)
 
             self._invalidate_cache()
             self.update()
@@ -1281,13 +2002,44 @@ if _QT_AVAILABLE:
             cy = self.height() / 2.0 + self._offset_y
             return (sx - cx) / self._zoom, (sy - cy) / self._zoom
 
+        def _screen_positions(self) -> List[Tuple[float, float]]:
+            """Screen centres of all nodes, recomputed only when stale."""
+            key = (
+                self._layout_version, self._zoom, self._offset_x, self._offset_y,
+                self.width(), self.height(),
+            )
+            if key != self._screen_key:
+                z = self._zoom
+                cx = self.width() / 2.0 + self._offset_x
+                cy = self.height() / 2.0 + self._offset_y
+                self._screen_xy = [
+                    (cx + n.x * z, cy + n.y * z) for n in self._nodes
+                ]
+                self._screen_key = key
+            return self._screen_xy
+
+        def _node_brush(self, argb: int, alpha: int = 255, lighter: int = 100) -> "QBrush":
+            """Cached brush for a node colour, optionally lightened/translucent."""
+            key = (argb, alpha, lighter)
+            brush = self._brush_cache.get(key)
+            if brush is None:
+                color = QColor.fromRgba(argb)
+                if lighter != 100:
+                    color = color.lighter(lighter)
+                color.setAlpha(alpha)
+                brush = self._brush_cache[key] = QBrush(color)
+            return brush
+
         def _hit_test(self, sx: float, sy: float) -> int:
             """Return index of node under screen point, or -1."""
+            if self._layout_pending:
+                return -1
             best = -1
             best_dist_sq = float("inf")
-            for i, node in enumerate(self._nodes):
-                nx, ny = self._world_to_screen(node["x"], node["y"])
-                r = (node["radius"] + 4) * self._zoom  # extra hit margin
+            for i, (node, (nx, ny)) in enumerate(
+                zip(self._nodes, self._screen_positions())
+            ):
+                r = (node.radius + 4) * self._zoom  # extra hit margin
                 dx = sx - nx
                 dy = sy - ny
                 d2 = dx * dx + dy * dy
@@ -1339,8 +2091,8 @@ if _QT_AVAILABLE:
             # Background gradient (subtle radial feel via vertical gradient)
             painter.fillRect(0, 0, w, h, QColor(24, 24, 26))
 
-            # Empty state
-            if not self._nodes:
+            # Empty state (or layout still running in the background)
+            if not self._nodes or self._layout_pending:
                 painter.setPen(QColor(100, 100, 100))
                 font = painter.font()
                 font.setPointSize(13)
@@ -1364,17 +2116,19 @@ if _QT_AVAILABLE:
                 Qt.PenStyle.NoPen if hasattr(Qt, "PenStyle") else Qt.NoPen
             )
 
+            screen_xy = self._screen_positions()
+
             # --- Edges ---------------------------------------------------
             for src, tgt in self._edges:
                 if src >= num or tgt >= num:
                     continue
                 ns = self._nodes[src]
                 nt = self._nodes[tgt]
-                x1, y1 = self._world_to_screen(ns["x"], ns["y"])
-                x2, y2 = self._world_to_screen(nt["x"], nt["y"])
+                x1, y1 = screen_xy[src]
+                x2, y2 = screen_xy[tgt]
 
                 # Edge brightness based on connected-node importance
-                importance = min(ns["connections"] + nt["connections"], 20)
+                importance = min(ns.connections + nt.connections, 20)
                 alpha = 25 + int(importance * 3.5)
 
                 # Highlight edges connected to hovered/selected node
@@ -1419,8 +2173,8 @@ if _QT_AVAILABLE:
             small_label_font.setPointSizeF(max(7.0, 8.0 * min(z, 1.4)))
 
             for i, node in enumerate(self._nodes):
-                sx, sy = self._world_to_screen(node["x"], node["y"])
-                r = node["radius"] * z
+                sx, sy = screen_xy[i]
+                r = node.radius * z
 
                 # Cull off-screen nodes (generous margin for labels)
                 if sx + r + 150 < 0 or sx - r - 150 > w:
@@ -1431,35 +2185,31 @@ if _QT_AVAILABLE:
                 is_hovered = i == self._hovered_idx
                 is_selected = i == self._selected_idx
                 is_neighbor = i in focus_neighbors
-                conns = node["connections"]
+                conns = node.connections
 
                 # Glow for hovered / selected / neighbor / high-connection
                 if is_hovered or is_selected:
                     glow_r = r + 8 * z
-                    gc = QColor(node["color"])
-                    gc.setAlpha(55 if is_hovered else 40)
                     painter.setPen(no_pen)
-                    painter.setBrush(QBrush(gc))
+                    painter.setBrush(
+                        self._node_brush(node.color, 55 if is_hovered else 40)
+                    )
                     painter.drawEllipse(
                         int(sx - glow_r), int(sy - glow_r),
                         int(glow_r * 2), int(glow_r * 2),
                     )
                 elif is_neighbor:
                     glow_r = r + 6 * z
-                    gc = QColor(node["color"])
-                    gc.setAlpha(30)
                     painter.setPen(no_pen)
-                    painter.setBrush(QBrush(gc))
+                    painter.setBrush(self._node_brush(node.color, 30))
                     painter.drawEllipse(
                         int(sx - glow_r), int(sy - glow_r),
                         int(glow_r * 2), int(glow_r * 2),
                     )
                 elif conns >= 6:
                     glow_r = r + 5 * z
-                    gc = QColor(node["color"])
-                    gc.setAlpha(20)
                     painter.setPen(no_pen)
-                    painter.setBrush(QBrush(gc))
+                    painter.setBrush(self._node_brush(node.color, 20))
                     painter.drawEllipse(
                         int(sx - glow_r), int(sy - glow_r),
                         int(glow_r * 2), int(glow_r * 2),
@@ -1467,14 +2217,15 @@ if _QT_AVAILABLE:
 
                 # Node circle
                 painter.setPen(no_pen)
-                fill = QColor(node["color"])
                 if is_hovered:
-                    fill = fill.lighter(130)
+                    lighter = 130
                 elif is_selected:
-                    fill = fill.lighter(120)
+                    lighter = 120
                 elif is_neighbor:
-                    fill = fill.lighter(110)
-                painter.setBrush(QBrush(fill))
+                    lighter = 110
+                else:
+                    lighter = 100
+                painter.setBrush(self._node_brush(node.color, lighter=lighter))
                 painter.drawEllipse(
                     int(sx - r), int(sy - r), int(r * 2), int(r * 2)
                 )
@@ -1508,7 +2259,7 @@ if _QT_AVAILABLE:
                     or z >= 3.0
                 )
                 if show_label:
-                    name = node["name"]
+                    name = node.name
 
                     # Font and alpha based on focus state
                     if is_hovered or is_selected:
@@ -1559,15 +2310,15 @@ if _QT_AVAILABLE:
             # --- Hover tooltip -------------------------------------------
             if self._hovered_idx >= 0 and self._hovered_idx < num:
                 hn = self._nodes[self._hovered_idx]
-                sx, sy = self._world_to_screen(hn["x"], hn["y"])
-                r = hn["radius"] * z
+                sx, sy = screen_xy[self._hovered_idx]
+                r = hn.radius * z
 
                 tip_lines = [
-                    hn["name"],
-                    f"{hn['connections']} connections",
+                    hn.name,
+                    f"{hn.connections} connections",
                 ]
-                if hn.get("rel_path"):
-                    tip_lines.append(hn["rel_path"])
+                if hn.rel_path:
+                    tip_lines.append(hn.rel_path)
 
                 # Tooltip background
                 tip_font = painter.font()
@@ -1714,7 +2465,7 @@ if _QT_AVAILABLE:
 
                     if hit >= 0 and hit != old_sel:
                         node = self._nodes[hit]
-                        self.node_clicked.emit(node.get("path", ""), node["name"])
+                        self.node_clicked.emit(node.path, node.name)
 
                     self._invalidate_cache()
                     self.update()
@@ -1737,7 +2488,7 @@ if _QT_AVAILABLE:
             """Double-click a node to open it in the system editor."""
             hit = self._hit_test(event.pos().x(), event.pos().y())
             if hit >= 0:
-                fpath = self._nodes[hit].get("path", "")
+                fpath = self._nodes[hit].path
                 if fpath and os.path.isfile(fpath):
                     import subprocess
                     try:
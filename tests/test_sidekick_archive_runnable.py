@@ -0,0 +1,58 @@
+"""
+Tests for _ArchiveRunnable in lib/sidekick/ui_module.py.
+
+The runnable must always emit a dict so the main window's finished slot
+clears its _archive_running flag.  Skipped when no Qt binding is installed.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from lib.sidekick.ui_module import _QT_AVAILABLE, _ArchiveRunnable  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not _QT_AVAILABLE, reason="PyQt6/PyQt5 not installed")
+
+
+class _Worker:
+    def __init__(self, result=None, exc=None):
+        self._result = result
+        self._exc = exc
+
+    def run_archive_cycle(self):
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
+def _run(worker):
+    received = []
+    runnable = _ArchiveRunnable(worker)
+    runnable.signals.finished.connect(received.append)
+    runnable.run()  # synchronously; same-thread emit calls the slot directly
+    return received
+
+
+def test_dict_result_passes_through():
+    assert _run(_Worker({"batches_created": 2, "errors": []})) == [
+        {"batches_created": 2, "errors": []}
+    ]
+
+
+def test_exception_emits_error_dict():
+    (result,) = _run(_Worker(exc=RuntimeError("db locked")))
+    assert result == {"batches_created": 0, "errors": ["db locked"]}
+
+
+@pytest.mark.parametrize("bad", [None, [], "done", 3])
+def test_non_dict_result_still_emits(bad):
+    (result,) = _run(_Worker(bad))
+    assert result["batches_created"] == 0
+    assert result["errors"]
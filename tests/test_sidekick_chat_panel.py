@@ -0,0 +1,243 @@
+"""
+Tests for ChatPanel bubble virtualisation in lib/sidekick/ui_module.py.
+
+Runs against an offscreen Qt platform; skipped when no Qt binding is
+installed.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from lib.sidekick.ui_module import (  # noqa: E402
+    _QT_AVAILABLE,
+    ChatMessage,
+    ChatMessageWidget,
+    ChatPanel,
+    Theme,
+    build_stylesheet,
+)
+
+pytestmark = pytest.mark.skipif(not _QT_AVAILABLE, reason="PyQt6/PyQt5 not installed")
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def panel(qapp):
+    p = ChatPanel()
+    p.resize(600, 800)
+    yield p
+    p.deleteLater()
+
+
+def _msgs(start, count):
+    return [ChatMessage("user", f"msg {i}") for i in range(start, start + count)]
+
+
+def _live_texts(panel):
+    layout = panel._msg_layout
+    # Index 0 and the last index are the top/bottom spacers
+    return [layout.itemAt(i).widget().message.text for i in range(1, layout.count() - 1)]
+
+
+def _evicted_texts(panel):
+    return [m.text for m in panel._evicted]
+
+
+# ---------------------------------------------------------------------------
+# add_messages
+# ---------------------------------------------------------------------------
+
+def test_add_messages_keeps_evicted_chronological(panel):
+    cap = ChatPanel._MAX_LIVE_BUBBLES
+    first = _msgs(0, 10)
+    for msg in first:
+        panel.add_message(msg)
+    batch = _msgs(10, cap + 50)
+    panel.add_messages(batch)
+
+    total = 10 + cap + 50
+    assert _evicted_texts(panel) == [f"msg {i}" for i in range(total - cap)]
+    assert _live_texts(panel) == [f"msg {i}" for i in range(total - cap, total)]
+
+
+# ---------------------------------------------------------------------------
+# Eviction / spacer / rehydration
+# ---------------------------------------------------------------------------
+
+def test_live_bubbles_capped(panel, qapp):
+    cap = ChatPanel._MAX_LIVE_BUBBLES
+    panel.show()
+    for msg in _msgs(0, cap + 40):
+        panel.add_message(msg)
+        qapp.processEvents()
+
+    assert panel._live_count() == cap
+    assert _evicted_texts(panel) == [f"msg {i}" for i in range(40)]
+    assert _live_texts(panel)[0] == "msg 40"
+
+
+def test_spacer_height_matches_evicted_heights(panel, qapp):
+    cap = ChatPanel._MAX_LIVE_BUBBLES
+    panel.show()
+    panel.add_messages(_msgs(0, cap + 20))
+    for msg in _msgs(cap + 20, 15):
+        panel.add_message(msg)
+        qapp.processEvents()
+
+    assert len(panel._evicted_heights) == len(panel._evicted) == 35
+    assert panel._top_spacer.height() == sum(panel._evicted_heights)
+    assert panel._top_spacer.isVisibleTo(panel)
+
+    panel._rehydrate_older()
+    qapp.processEvents()
+    assert panel._top_spacer.height() == sum(panel._evicted_heights)
+
+
+def test_rehydration_keeps_live_count_capped(panel, qapp):
+    cap = ChatPanel._MAX_LIVE_BUBBLES
+    total = cap + 75
+    panel.show()
+    for msg in _msgs(0, 10):
+        panel.add_message(msg)
+    panel.add_messages(_msgs(10, total - 10))
+    qapp.processEvents()
+
+    while panel._evicted:
+        panel._rehydrate_older()
+        qapp.processEvents()  # runs the deferred scroll-anchor restore
+        assert panel._live_count() <= cap
+        # Parked above + live + parked below is always the full history
+        texts = _evicted_texts(panel) + _live_texts(panel) + [m.text for m in panel._below]
+        assert texts == [f"msg {i}" for i in range(total)]
+
+    assert _live_texts(panel) == [f"msg {i}" for i in range(cap)]
+    assert len(panel._below_heights) == len(panel._below) == total - cap
+    assert panel._bottom_spacer.height() == sum(panel._below_heights)
+    assert panel._evicted_heights == []
+    assert panel._top_spacer.height() == 0
+    assert not panel._top_spacer.isVisibleTo(panel)
+
+
+def test_rehydrating_newer_restores_latest(panel, qapp):
+    cap = ChatPanel._MAX_LIVE_BUBBLES
+    total = cap + 75
+    panel.show()
+    panel.add_messages(_msgs(0, total))
+    qapp.processEvents()
+    while panel._evicted:
+        panel._rehydrate_older()
+        qapp.processEvents()
+
+    while panel._below:
+        panel._rehydrate_newer()
+        qapp.processEvents()
+        assert panel._live_count() <= cap
+        texts = _evicted_texts(panel) + _live_texts(panel) + [m.text for m in panel._below]
+        assert texts == [f"msg {i}" for i in range(total)]
+
+    assert _live_texts(panel) == [f"msg {i}" for i in range(total - cap, total)]
+    assert panel._bottom_spacer.height() == 0
+    assert panel._top_spacer.height() == sum(panel._evicted_heights)
+
+
+def _settle(panel, qapp):
+    """Run the event loop until chained rehydration has finished."""
+    qapp.processEvents()
+    while panel._rehydrating:
+        qapp.processEvents()
+
+
+def _visible_texts(panel):
+    """Texts of the bubbles that intersect the viewport."""
+    top = panel._scroll.verticalScrollBar().value()
+    bottom = top + panel._scroll.viewport().height()
+    layout = panel._msg_layout
+    texts = []
+    for i in range(1, layout.count() - 1):
+        w = layout.itemAt(i).widget()
+        if w.y() < bottom and w.y() + w.height() > top:
+            texts.append(w.message.text)
+    return texts
+
+
+def test_new_message_while_scrolled_up_keeps_viewport(panel, qapp):
+    total = 400
+    panel.show()
+    panel.add_messages(_msgs(0, total))
+    qapp.processEvents()
+    sb = panel._scroll.verticalScrollBar()
+    sb.setValue(0)  # rehydrates until the oldest messages are live
+    _settle(panel, qapp)
+    sb.setValue(sb.value() + 200)
+    _settle(panel, qapp)
+    assert panel._below
+    before = _visible_texts(panel)
+    assert before
+
+    panel.add_message(ChatMessage("user", f"msg {total}"))
+    qapp.processEvents()
+
+    assert _visible_texts(panel) == before
+    assert panel._below[-1].text == f"msg {total}"
+    assert panel._bottom_spacer.height() == sum(panel._below_heights)
+    texts = _evicted_texts(panel) + _live_texts(panel) + [m.text for m in panel._below]
+    assert texts == [f"msg {i}" for i in range(total + 1)]
+
+
+def test_jump_to_latest_shows_newest(panel, qapp):
+    total = 400
+    panel.show()
+    panel.add_messages(_msgs(0, total))
+    qapp.processEvents()
+    panel._scroll.verticalScrollBar().setValue(0)
+    _settle(panel, qapp)
+    panel.add_message(ChatMessage("user", f"msg {total}"))
+    assert panel._below
+
+    panel._jump_to_latest()
+    qapp.processEvents()
+
+    assert panel._below == []
+    assert panel._auto_scroll
+    assert f"msg {total}" in _visible_texts(panel)
+
+
+# ---------------------------------------------------------------------------
+# Styling
+# ---------------------------------------------------------------------------
+
+def test_bubbles_paint_their_role_background(panel, qapp):
+    # The container's own sheet must not override the global bubble rules
+    panel.setStyleSheet(build_stylesheet(Theme))
+    for role in ("user", "assistant", "system"):
+        panel.add_message(ChatMessage(role, f"hello {role}"))
+    panel.show()
+    qapp.processEvents()
+
+    img = panel._container.grab().toImage()
+    backdrop = img.pixelColor(2, 2).rgb()
+    fills = {}
+    for bubble in panel._container.findChildren(ChatMessageWidget):
+        g = bubble.geometry()
+        fills[bubble.message.role] = img.pixelColor(g.right() - 12, g.center().y()).rgb()
+        body = bubble.body_label.geometry().translated(g.topLeft())
+        assert img.pixelColor(body.right() - 2, body.top() + 1).rgb() == fills[bubble.message.role]
+
+    assert backdrop not in fills.values()
+    assert len(set(fills.values())) == 3
@@ -0,0 +1,60 @@
+"""
+Tests for token metrics in KaitMainWindow._apply_pending_metrics.
+
+The context gauge is bucketed to skip sub-pixel repaints, but the header
+label must always show the exact count.  Skipped when no Qt binding is
+installed.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from lib.sidekick.ui_module import _QT_AVAILABLE, KaitMainWindow  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not _QT_AVAILABLE, reason="PyQt6/PyQt5 not installed")
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(qapp):
+    w = KaitMainWindow()
+    yield w
+    w.deleteLater()
+
+
+def _apply(window, used, maximum=128_000):
+    window._pending_metrics = {"tokens_used": used, "tokens_max": maximum}
+    window._apply_pending_metrics()
+
+
+def test_header_tokens_follow_changes_within_a_gauge_bucket(window):
+    _apply(window, 100)
+    _apply(window, 120)
+    assert window._header_bar._token_label.text() == "Tokens: 120/128k"
+
+
+def test_gauge_skips_updates_within_a_bucket(window, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        window._monitor, "update_context_gauge", lambda u, m: calls.append(u),
+    )
+    _apply(window, 100)
+    _apply(window, 120)
+    _apply(window, 100 + KaitMainWindow._METRICS_TOKEN_BUCKET)
+    assert calls == [100, 100 + KaitMainWindow._METRICS_TOKEN_BUCKET]
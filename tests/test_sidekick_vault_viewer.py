@@ -0,0 +1,127 @@
+"""
+Tests for the vault scan and graph helpers in lib/sidekick/vault_viewer.py.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from lib.sidekick import vault_viewer  # noqa: E402
+from lib.sidekick.vault_viewer import _QT_AVAILABLE  # noqa: E402
+
+
+@pytest.fixture
+def vault(tmp_path):
+    root = tmp_path / "vault"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.md").write_text("# A\n", encoding="utf-8")
+    (root / "sub" / "b.md").write_text("# B\n", encoding="utf-8")
+    yield root
+    vault_viewer._SCAN_CACHE.pop(str(root), None)
+
+
+# ---------------------------------------------------------------------------
+# Background scan
+# ---------------------------------------------------------------------------
+
+def _run_scan(vault_path):
+    received = []
+    runnable = vault_viewer._VaultScanRunnable(vault_path)
+    runnable.signals.finished.connect(received.append)
+    runnable.run()  # synchronously; same-thread emit calls the slot directly
+    return received
+
+
+@pytest.mark.skipif(not _QT_AVAILABLE, reason="PyQt6/PyQt5 not installed")
+def test_scan_runnable_emits_files_and_dirs(vault):
+    ((files, dirs),) = _run_scan(str(vault))
+    assert [f["rel_path"] for f in files] == ["a.md", os.path.join("sub", "b.md")]
+    assert dirs == [str(vault), str(vault / "sub")]
+
+
+@pytest.mark.skipif(not _QT_AVAILABLE, reason="PyQt6/PyQt5 not installed")
+def test_scan_runnable_emits_empty_result_on_failure(vault, monkeypatch):
+    def boom(_path):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(vault_viewer, "_scan_vault_cached", boom)
+    assert _run_scan(str(vault)) == [([], [])]
+
+
+# ---------------------------------------------------------------------------
+# Scan memo
+# ---------------------------------------------------------------------------
+
+def test_memoised_scan_is_returned_unchanged(vault, monkeypatch):
+    first = vault_viewer._scan_vault(str(vault))
+
+    def no_file_stat(path, *args, **kwargs):
+        assert not str(path).endswith(".md"), "cache hit re-stat'ed a note"
+        return real_stat(path, *args, **kwargs)
+
+    real_stat = os.stat
+    monkeypatch.setattr(vault_viewer.os, "stat", no_file_stat)
+    assert vault_viewer._scan_vault(str(vault)) == first
+
+
+def test_restat_scanned_file_replaces_memo_entry(vault):
+    note = vault / "a.md"
+    (first,) = [f for f in vault_viewer._scan_vault(str(vault)) if f["name"] == "a.md"]
+    old = dict(first)
+
+    note.write_text("# A\n\nmuch longer body than before\n", encoding="utf-8")
+    bumped = int(first["mtime"] * 1e9) + 5_000_000_000
+    os.utime(note, ns=(bumped, bumped))
+
+    entry = vault_viewer._restat_scanned_file(str(vault), str(note))
+    assert entry["size"] == note.stat().st_size
+    assert entry["mtime"] == note.stat().st_mtime
+    assert first == old  # the shared dict is left untouched
+    (again,) = [f for f in vault_viewer._scan_vault(str(vault)) if f["name"] == "a.md"]
+    assert again is entry
+
+
+def test_restat_scanned_file_reports_vanished_file(vault):
+    vault_viewer._scan_vault(str(vault))
+    (vault / "a.md").unlink()
+    assert vault_viewer._restat_scanned_file(str(vault), str(vault / "a.md")) is None
+
+
+# ---------------------------------------------------------------------------
+# Graph cache
+# ---------------------------------------------------------------------------
+
+def test_in_place_link_edit_invalidates_graph_cache(vault, tmp_path, monkeypatch):
+    monkeypatch.setattr(vault_viewer, "_GRAPH_CACHE_DIR", tmp_path / "graph_cache")
+    nodes, edges = vault_viewer._build_vault_graph(str(vault))
+    assert {n["name"] for n in nodes} == {"a", "b"}
+    assert edges == []
+
+    dir_mtime = os.stat(vault).st_mtime_ns
+    (vault / "a.md").write_text("# A\n\nSee [[b]].\n", encoding="utf-8")
+    assert os.stat(vault).st_mtime_ns == dir_mtime  # scan memo is still "valid"
+
+    # No watcher is involved: the fingerprint re-stats the notes itself
+    nodes, edges = vault_viewer._build_vault_graph(str(vault))
+    assert len(edges) == 1
+    assert {n["name"]: n["connections"] for n in nodes} == {"a": 1, "b": 1}
+
+
+def test_link_added_to_empty_note_is_read(vault, tmp_path, monkeypatch):
+    monkeypatch.setattr(vault_viewer, "_GRAPH_CACHE_DIR", tmp_path / "graph_cache")
+    (vault / "c.md").write_text("", encoding="utf-8")
+    _, edges = vault_viewer._build_vault_graph(str(vault))
+    assert edges == []
+
+    # The memoised scan entry still says size 0
+    (vault / "c.md").write_text("[[a]]\n", encoding="utf-8")
+    nodes, edges = vault_viewer._build_vault_graph(str(vault))
+    assert len(edges) == 1
+    assert {n["name"]: n["connections"] for n in nodes}["c"] == 1